@@ -1,6 +1,6 @@
 from datetime import datetime, date
-from sqlalchemy import String, Integer, DateTime, func, ForeignKey, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, DateTime, func, ForeignKey, Text, Index, select
+from sqlalchemy.orm import Mapped, mapped_column, column_property
 
 from database import Base
 
@@ -33,9 +33,18 @@ class Pin(Base):
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     content: Mapped[str] = mapped_column(Text)
     image: Mapped[str] = mapped_column(String(255))
+    # 좋아요/댓글 수 (likes, comments 변경과 같은 트랜잭션에서 갱신)
+    like_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    comment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_pins_updated_at_pin_id", "updated_at", "pin_id"), # 전체 핀 조회
+        Index("ix_pins_user_id_updated_at_pin_id", "user_id", "updated_at", "pin_id"), # 작성한 핀
+        Index("ix_pins_image", "image"), # 이미지 참조 수 계산
+    )
+
 
 class Like(Base):
     __tablename__ = "likes"
@@ -46,6 +55,12 @@ class Like(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        Index("uq_likes_user_id_pin_id", "user_id", "pin_id", unique=True), # 중복 즐겨찾기 방지
+        Index("ix_likes_pin_id", "pin_id"), # 핀 삭제 시 CASCADE
+        Index("ix_likes_user_id_created_at_like_id", "user_id", "created_at", "like_id"), # 즐겨찾기한 핀
+    )
+
 class Comment(Base):
     __tablename__ = "comments"
 
@@ -54,4 +69,60 @@ class Comment(Base):
     pin_id: Mapped[int] = mapped_column(Integer, ForeignKey('pins.pin_id', ondelete='CASCADE'))
     content: Mapped[str] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone = True), server_default = func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
\ No newline at end of file
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_comments_pin_id_created_at", "pin_id", "created_at", "comment_id"), # 댓글 불러오기
+    )
+
+
+# 내용 해시(sha256) 기반 이미지 저장소
+# 같은 이미지는 한 번만 저장하고, 참조하는 핀 수를 ref_count로 관리
+class Image(Base):
+    __tablename__ = "images"
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True) # sha256 hex
+    path: Mapped[str] = mapped_column(String(255), unique=True, nullable=False) # /src/<digest>.<ext>
+    size: Mapped[int] = mapped_column(Integer, nullable=False) # bytes
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0") # 참조하는 핀 수
+    variants: Mapped[str | None] = mapped_column(String(64)) # 생성된 리사이즈 너비 e.g. "236,474" (NULL: 생성 전)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+# 조회 캐시 무효화 기록 (여러 워커 프로세스가 공유)
+# 쓰기 트랜잭션에서 scope의 seq를 올리면 다른 워커가 seq > 마지막 확인값 인 scope를 무효화
+class CacheInvalidation(Base):
+    __tablename__ = "cache_invalidations"
+
+    scope: Mapped[str] = mapped_column(String(64), primary_key=True) # e.g. "pin:1", "feed:head"
+    seq: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+
+
+# 응답 후 처리할 백그라운드 작업 (services.jobs)
+# 쓰기 트랜잭션과 함께 커밋되므로 서버가 재시작돼도 남아 있음
+class Job(Base):
+    __tablename__ = "jobs"
+
+    job_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    kind: Mapped[str] = mapped_column(String(64), nullable=False) # 핸들러 이름 e.g. "thumbnails.generate"
+    payload: Mapped[str] = mapped_column(Text, nullable=False) # JSON
+    idempotency_key: Mapped[str | None] = mapped_column(String(255), unique=True) # 같은 키는 한 번만 등록
+    status: Mapped[str] = mapped_column(String(16), nullable=False, server_default="queued") # queued | running | done | failed
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    run_after: Mapped[datetime] = mapped_column(DateTime, nullable=False) # 실행 가능 시각 (running: 임대 만료 시각)
+    last_error: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime)
+
+    __table_args__ = (
+        Index("ix_jobs_status_run_after", "status", "run_after"), # 실행할 작업 / 오래된 작업 정리
+    )
+
+
+# 핀 이미지의 리사이즈 생성 상태 (핀 조회 시 함께 로드)
+Pin.variant_widths = column_property(
+    select(Image.variants).where(Image.path == Pin.image).scalar_subquery()
+)
@@ -0,0 +1,74 @@
+"""
+벤치마크 결과 비교
+
+두 JSON 결과(bench.workload / bench.concurrency)의 엔드포인트별 처리량과
+p50/p95/p99 지연시간 변화를 출력한다.
+p95 또는 p99 가 --threshold % 이상 느려진 엔드포인트가 있으면 종료 코드 1
+
+    python -m bench.compare before.json after.json [--threshold 10]
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+METRICS = ("rps", "p50_ms", "p95_ms", "p99_ms")
+# 이보다 작은 지연시간 차이(ms)는 측정 오차로 보고 회귀로 판단하지 않음
+NOISE_MS = 1.0
+
+
+def _change(before: float, after: float) -> float:
+    return (after - before) / before * 100 if before else 0.0
+
+
+def compare(before: dict, after: dict, threshold: float) -> tuple[list[str], list[str]]:
+    """
+    출력할 줄 목록과 회귀한 엔드포인트 목록 반환
+    """
+    lines = [f"{'endpoint':<14}" + "".join(f"{metric:>22}" for metric in METRICS)]
+    regressions = []
+
+    endpoints = before["endpoints"].keys() | after["endpoints"].keys()
+    for name in sorted(endpoints):
+        old, new = before["endpoints"].get(name), after["endpoints"].get(name)
+        if old is None or new is None:
+            lines.append(f"{name:<14}  {'only in ' + ('after' if old is None else 'before')}")
+            continue
+
+        cells = []
+        for metric in METRICS:
+            change = _change(old[metric], new[metric])
+            cells.append(f"{old[metric]:>8} → {new[metric]:<8}{change:+5.0f}%")
+            # 처리량은 높을수록, 지연시간은 낮을수록 좋음
+            if metric in ("p95_ms", "p99_ms") and change > threshold and new[metric] - old[metric] > NOISE_MS:
+                regressions.append(f"{name} {metric}")
+        lines.append(f"{name:<14}" + "".join(f"{cell:>22}" for cell in cells))
+
+    return lines, regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=10.0, help="회귀로 판단할 지연시간 증가율(%%)")
+    args = parser.parse_args()
+
+    before = json.loads(Path(args.before).read_text())
+    after = json.loads(Path(args.after).read_text())
+
+    for label, report in (("before", before), ("after", after)):
+        commit = report.get("environment", {}).get("commit", "?")
+        print(f"{label}: {report.get('benchmark')} @ {commit} {report.get('params', {})}")
+
+    lines, regressions = compare(before, after, args.threshold)
+    print("\n".join(lines))
+
+    if regressions:
+        print(f"\nregressions (> {args.threshold:g}%): " + ", ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+동시 부하 지연시간 벤치마크
+
+임시 SQLite DB에 핀을 채운 뒤, 가벼운 요청(핀 상세보기)과 무거운 요청(검색)을
+동시에 보내 엔드포인트별 p50/p95/p99 지연시간을 측정한다.
+DB 호출이 이벤트 루프를 막으면 무거운 요청 뒤에 가벼운 요청이 줄을 서서
+상세보기 p99가 크게 늘어난다.
+
+    python -m bench.concurrency --output after.json
+
+변경 전 코드와 비교하려면 이전 커밋을 체크아웃한 폴더를 --app-dir 로 지정한다.
+
+    git worktree add /tmp/before <commit>
+    python -m bench.concurrency --app-dir /tmp/before --output before.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+WORDS = ["cat", "dog", "tree", "house", "ocean", "city", "food", "travel", "art", "music"]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(latencies: dict[str, list[float]], elapsed: float) -> dict:
+    result = {}
+    for name, values in latencies.items():
+        result[name] = {
+            "count": len(values),
+            "rps": round(len(values) / elapsed, 1),
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+            "mean_ms": round(statistics.fmean(values) * 1000, 2),
+        }
+    return result
+
+
+def use_database(path: str):
+    """
+    앱이 임시 DB를 바라보도록 설정 (main import 전에 호출)
+    앱은 시작 시 테이블을 만들지 않으므로 Alembic head 까지 마이그레이션
+    """
+    from bench.seed import migrate
+
+    url = f"sqlite:///{path}"
+    os.environ["DATABASE_URL"] = url
+    migrate(url)
+
+    import database
+
+    # DATABASE_URL 을 읽지 않는 이전 코드 버전이면 엔진 직접 교체
+    if str(database.engine.url) != url:
+        from sqlalchemy import create_engine
+
+        database.engine = create_engine(url, connect_args={"check_same_thread": False})
+        database.SessionLocal.configure(bind=database.engine)
+
+        if hasattr(database, "async_engine"):
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            database.async_engine = create_async_engine(url.replace("sqlite://", "sqlite+aiosqlite://"))
+            database.AsyncSessionLocal.configure(bind=database.async_engine)
+
+    return database
+
+
+def seed(database, pins: int) -> None:
+    from sqlalchemy import insert
+
+    from api.models import Pin, User
+
+    rng = random.Random(42)
+    with database.engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {"email": f"bench{i}@example.com", "password_hash": "x", "username": f"bench{i}"}
+                for i in range(100)
+            ],
+        )
+        conn.execute(
+            insert(Pin),
+            [
+                {
+                    "user_id": rng.randint(1, 100),
+                    "title": " ".join(rng.choices(WORDS, k=3)),
+                    "content": " ".join(rng.choices(WORDS, k=40)),
+                    "image": "/src/bench.jpg",
+                }
+                for _ in range(pins)
+            ],
+        )
+
+    try:
+        from services import search
+    except ImportError:
+        return
+    with database.SessionLocal() as db:
+        search.rebuild(db)
+        db.commit()
+
+
+async def run(app, pins: int, clients: int, requests: int, search_ratio: float) -> dict:
+    import httpx
+
+    latencies: dict[str, list[float]] = {"detail": [], "search": []}
+    errors = 0
+    remaining = requests
+    rng = random.Random(7)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+
+        async def worker():
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                if rng.random() < search_ratio:
+                    name, url = "search", f"/api/pins/search?search={rng.choice(WORDS)}"
+                else:
+                    name, url = "detail", f"/api/pins/{rng.randint(1, pins)}"
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                except Exception:
+                    errors += 1
+                    continue
+                latencies[name].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+
+    return {"errors": errors, "endpoints": summarize(latencies, elapsed)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app-dir", default=os.getcwd(), help="벤치마크할 백엔드 코드 경로")
+    parser.add_argument("--pins", type=int, default=20000)
+    # 동기 세션 버전은 커넥션 풀(5 + overflow 10)보다 동시 요청이 많으면
+    # 루프가 풀 대기에 막혀 멈추므로 기본값은 풀 크기 이하로 둔다
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--search-ratio", type=float, default=0.1)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    app_dir = str(Path(args.app_dir).resolve())
+    sys.path.insert(0, app_dir)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 앱은 작업 폴더 기준 src/ 를 마운트하므로 임시 폴더에서 실행
+        os.chdir(tmp)
+        os.makedirs("src", exist_ok=True)
+
+        database = use_database(f"{tmp}/bench.db")
+        import main as app_main
+
+        seed(database, args.pins)
+        result = asyncio.run(
+            run(app_main.app, args.pins, args.clients, args.requests, args.search_ratio)
+        )
+        os.chdir(app_dir)
+
+    report = {
+        "benchmark": "concurrency",
+        "params": {k: v for k, v in vars(args).items() if k not in ("app_dir", "output")},
+        **result,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
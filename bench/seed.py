@@ -0,0 +1,164 @@
+"""
+벤치마크용 합성 데이터 생성
+
+사용자 / 핀 / 좋아요 / 댓글을 지정한 규모로 bulk insert 한다.
+같은 --seed 면 항상 같은 데이터가 만들어진다. (커밋 간 결과 비교용)
+
+    python -m bench.seed --db /tmp/bench.db --users 10000 --pins 1000000 --likes 5000000 --comments 1000000
+
+DB는 Alembic head 까지 마이그레이션한 뒤 채우고, 마지막에 좋아요/댓글 수와
+검색 인덱스를 다시 계산한다.
+"""
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+WORDS = ["cat", "dog", "tree", "house", "ocean", "city", "food", "travel", "art", "music"]
+# 모든 시드 사용자의 비밀번호 (로그인 부하용)
+PASSWORD = "bench-password"
+# 시드 핀이 공유하는 이미지 경로
+IMAGE = "/src/bench.gif"
+# 한 번에 insert 할 행 수
+CHUNK = 10000
+# 작성 시각 분포 (최근 N일)
+SPREAD_DAYS = 90
+
+
+def migrate(url: str) -> None:
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(BASE_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BASE_DIR / "migrations"))
+    config.set_main_option("sqlalchemy.url", url)
+    command.upgrade(config, "head")
+
+
+def _timestamps(rng: random.Random, count: int, now: datetime):
+    # SQLite CURRENT_TIMESTAMP 와 같은 텍스트 형식
+    for _ in range(count):
+        moment = now - timedelta(seconds=rng.randrange(SPREAD_DAYS * 86400))
+        yield moment.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _bulk(conn, table: str, columns: tuple[str, ...], rows, ignore: bool = False) -> None:
+    """
+    드라이버 executemany 로 CHUNK 행씩 insert
+    (ORM/DateTime 타입 변환을 거치지 않아 빠르고, 시각을 CURRENT_TIMESTAMP 와 같은 텍스트로 저장)
+    """
+    sql = (
+        f"INSERT {'OR IGNORE ' if ignore else ''}INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= CHUNK:
+            conn.exec_driver_sql(sql, batch)
+            batch = []
+    if batch:
+        conn.exec_driver_sql(sql, batch)
+
+
+def seed(
+    database,
+    users: int,
+    pins: int,
+    likes: int = 0,
+    comments: int = 0,
+    seed: int = 42,
+) -> dict:
+    """
+    database.engine 에 합성 데이터 생성, 테이블별 행 수 반환
+    """
+    from sqlalchemy import func, select
+
+    from api.models import Comment, Like, Pin, User
+    from services import counters, search
+    from services.passwords import _context
+
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    # 해시는 비싸므로 한 번만 계산해 모든 사용자가 공유
+    password_hash = _context().hash(PASSWORD)
+
+    def words(k: int) -> str:
+        return " ".join(rng.choices(WORDS, k=k))
+
+    def popular_pin() -> int:
+        # 일부 핀에 좋아요가 몰리도록 30%는 앞쪽 핀 id에 집중
+        if rng.random() < 0.3:
+            return min(pins, int(rng.paretovariate(1.2)))
+        return rng.randint(1, pins)
+
+    with database.engine.begin() as conn:
+        _bulk(
+            conn, "users", ("email", "password_hash", "username"),
+            ((f"bench{i}@example.com", password_hash, f"bench{i}") for i in range(1, users + 1)),
+        )
+        _bulk(
+            conn, "pins", ("user_id", "title", "content", "image", "created_at", "updated_at"),
+            (
+                (rng.randint(1, users), words(3), words(40), IMAGE, created, created)
+                for created in _timestamps(rng, pins, now)
+            ),
+        )
+        _bulk(
+            conn, "images", ("digest", "path", "size", "ref_count"),
+            [("0" * 64, IMAGE, 0, pins)], ignore=True,
+        )
+        # 같은 (user_id, pin_id) 쌍은 무시되므로 실제 좋아요 수는 조금 적을 수 있음
+        _bulk(
+            conn, "likes", ("user_id", "pin_id", "created_at", "updated_at"),
+            (
+                (rng.randint(1, users), popular_pin(), created, created)
+                for created in _timestamps(rng, likes, now)
+            ),
+            ignore=True,
+        )
+        _bulk(
+            conn, "comments", ("user_id", "pin_id", "content", "created_at", "updated_at"),
+            (
+                (rng.randint(1, users), rng.randint(1, pins), words(8), created, created)
+                for created in _timestamps(rng, comments, now)
+            ),
+        )
+
+    with database.SessionLocal() as db:
+        counters.reconcile(db, invalidate=False)
+        search.rebuild(db)
+        db.commit()
+        return {
+            model.__tablename__: db.execute(select(func.count()).select_from(model)).scalar()
+            for model in (User, Pin, Like, Comment)
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", required=True, help="생성할 SQLite 파일 경로 (없으면 새로 생성)")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--pins", type=int, default=20000)
+    parser.add_argument("--likes", type=int, default=100000)
+    parser.add_argument("--comments", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    url = f"sqlite:///{Path(args.db).resolve()}"
+    os.environ["DATABASE_URL"] = url
+    migrate(url)
+
+    import database
+
+    started = time.perf_counter()
+    counts = seed(database, args.users, args.pins, args.likes, args.comments, args.seed)
+    print(counts, f"{time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
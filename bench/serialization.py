@@ -0,0 +1,124 @@
+"""
+목록 응답 직렬화 벤치마크
+
+같은 핀 페이지를 두 가지 방식으로 만들어 단계별 시간을 비교한다.
+
+- orm:  select(Pin) → PinResponse 검증(from_attributes) → 표준 json 인코딩 (FastAPI 기본 경로)
+- fast: 필요한 컬럼만 튜플로 조회 → dict 생성 → orjson 인코딩 (services.serialization)
+
+    python -m bench.serialization --limit 100 --output after.json
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from bench.seed import migrate, seed
+from bench.workload import _environment
+
+
+def _timed(fn, repeat: int) -> tuple[float, object]:
+    """
+    repeat 번 실행한 중앙값(ms)과 마지막 결과
+    """
+    durations = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        durations.append(time.perf_counter() - started)
+    return round(statistics.median(durations) * 1000, 3), result
+
+
+def run(database, limit: int, repeat: int) -> dict:
+    from fastapi.encoders import jsonable_encoder
+    from sqlalchemy import select
+
+    import schemas
+    from api.models import Pin
+    from services import serialization
+
+    page_model = schemas.Page[schemas.PinResponse]
+    order = (Pin.updated_at.desc(), Pin.pin_id.desc())
+
+    with database.SessionLocal() as db:
+        def orm_query():
+            db.expunge_all()
+            return db.execute(select(Pin).order_by(*order).limit(limit)).scalars().all()
+
+        def fast_query():
+            return db.execute(select(*serialization.pin_columns()).order_by(*order).limit(limit)).all()
+
+        orm_query_ms, pins = _timed(orm_query, repeat)
+        fast_query_ms, rows = _timed(fast_query, repeat)
+
+    # FastAPI 기본 경로: response_model 검증 + jsonable_encoder + json.dumps
+    orm_validate_ms, validated = _timed(
+        lambda: jsonable_encoder(page_model.model_validate({"items": pins}, from_attributes=True)), repeat
+    )
+    orm_encode_ms, orm_body = _timed(
+        lambda: json.dumps(validated, ensure_ascii=False, separators=(",", ":")).encode(), repeat
+    )
+
+    fast_build_ms, page = _timed(
+        lambda: {"items": [serialization.pin_item(row) for row in rows], "next_cursor": None}, repeat
+    )
+    fast_encode_ms, fast_body = _timed(lambda: serialization.dumps(page), repeat)
+
+    # 두 경로의 응답 내용이 같은지 확인
+    if json.loads(orm_body) != json.loads(fast_body):
+        raise SystemExit("orm / fast 응답이 다릅니다")
+
+    return {
+        "encoder": "orjson" if serialization.orjson else "json",
+        "bytes": len(fast_body),
+        "orm": {
+            "query_ms": orm_query_ms,
+            "validate_ms": orm_validate_ms,
+            "encode_ms": orm_encode_ms,
+            "total_ms": round(orm_query_ms + orm_validate_ms + orm_encode_ms, 3),
+        },
+        "fast": {
+            "query_ms": fast_query_ms,
+            "validate_ms": fast_build_ms,
+            "encode_ms": fast_encode_ms,
+            "total_ms": round(fast_query_ms + fast_build_ms + fast_encode_ms, 3),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pins", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=100, help="페이지 크기")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/bench.db"
+        os.environ["DATABASE_URL"] = url
+        migrate(url)
+
+        import database
+
+        seed(database, users=100, pins=args.pins)
+        result = run(database, args.limit, args.repeat)
+        database.engine.dispose()
+
+    report = {
+        "benchmark": "serialization",
+        "environment": _environment(),
+        "params": {k: v for k, v in vars(args).items() if k != "output"},
+        **result,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+서버 시작 시간 벤치마크
+
+새 파이썬 프로세스에서 단계별 시간을 --runs 번 측정한다. (워커 재시작과 같은 콜드 스타트)
+
+- import:        `import main` (라우터 / 모델 / 미들웨어 로드)
+- startup:       lifespan 시작 (스키마 확인, 커넥션 워밍업)
+- first_request: 첫 핀 목록 조회
+- first_login:   첫 로그인 (비밀번호 해시 라이브러리 로드 포함)
+
+    python -m bench.startup --output after.json
+    python -m bench.startup --baseline before.json   # p95/p99 가 --threshold % 이상 느려지면 종료 코드 1
+
+결과는 bench.compare 와 같은 형식이라 `python -m bench.compare before.json after.json` 으로도 비교할 수 있다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench.compare import compare
+from bench.concurrency import summarize
+from bench.seed import PASSWORD, migrate, seed
+from bench.workload import _environment
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PHASES = ("import", "startup", "first_request", "first_login")
+
+
+def _child() -> None:
+    """
+    측정용 자식 프로세스 (단계별 소요 시간을 JSON 한 줄로 출력)
+    """
+    started = time.perf_counter()
+    import main
+    imported = time.perf_counter()
+
+    async def boot() -> dict:
+        import httpx
+
+        app = main.app
+        timings = {"import": imported - started}
+        async with app.router.lifespan_context(app):
+            ready = time.perf_counter()
+            timings["startup"] = ready - imported
+
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://bench"
+            ) as client:
+                (await client.get("/api/pins/")).raise_for_status()
+                timings["first_request"] = time.perf_counter() - ready
+
+                login_started = time.perf_counter()
+                (await client.post(
+                    "/api/users/login", json={"email": "bench1@example.com", "password": PASSWORD}
+                )).raise_for_status()
+                timings["first_login"] = time.perf_counter() - login_started
+        return timings
+
+    print(json.dumps(asyncio.run(boot())))
+
+
+def run(tmp: str, runs: int) -> dict:
+    samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    env = {**os.environ, "PYTHONPATH": str(BASE_DIR)}
+
+    started = time.perf_counter()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-m", "bench.startup", "--child"],
+            cwd=tmp, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        timings = json.loads(output.strip().splitlines()[-1])
+        for phase in PHASES:
+            samples[phase].append(timings[phase])
+    elapsed = time.perf_counter() - started
+
+    return {"endpoints": summarize(samples, elapsed)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=20.0, help="회귀로 판단할 증가율(%%)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child()
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/bench.db"
+        os.environ["DATABASE_URL"] = url
+        migrate(url)
+
+        import database
+
+        seed(database, users=10, pins=100)
+        database.engine.dispose()
+
+        # 앱은 작업 폴더 기준 src/ 를 마운트하므로 임시 폴더에서 실행
+        os.makedirs(f"{tmp}/src", exist_ok=True)
+        # 첫 실행은 .pyc 생성이 포함되므로 버림
+        run(tmp, 1)
+        result = run(tmp, args.runs)
+
+    report = {
+        "benchmark": "startup",
+        "environment": _environment(),
+        "params": {k: v for k, v in vars(args).items() if k not in ("baseline", "output", "child")},
+        **result,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        lines, regressions = compare(json.loads(Path(args.baseline).read_text()), report, args.threshold)
+        print("\n".join(lines))
+        if regressions:
+            print(f"\nregressions (> {args.threshold:g}%): " + ", ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""
+시나리오 혼합 부하 벤치마크 (모든 라우터)
+
+bench.seed 로 만든 데이터 위에서 피드 스크롤 / 상세 / 검색 / 좋아요 / 댓글 /
+업로드 / 로그인 / 프로필 요청을 비율대로 섞어 ASGI 앱에 직접(in-process) 보내고,
+시나리오별 처리량과 p50/p95/p99 지연시간을 JSON으로 저장한다.
+
+    python -m bench.workload --output after.json
+    python -m bench.compare before.json after.json
+
+이전 커밋과 비교하려면 그 커밋을 체크아웃한 폴더에서 같은 인자로 실행한다.
+
+    git worktree add /tmp/before <commit>
+    (cd /tmp/before && python -m bench.workload --output /tmp/before.json)
+
+--db 로 미리 만든 시드 DB를 주면 복사본에서 실행한다. (대용량 시드 재사용)
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from bench.concurrency import summarize
+from bench.seed import PASSWORD, WORDS, migrate, seed
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# 이미지 업로드용 1x1 GIF
+GIF = (
+    b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00"
+    b",\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+)
+
+# 시나리오별 기본 비율 (%)
+DEFAULT_MIX = {
+    "feed_scroll": 25,
+    "home_feed": 10,
+    "detail": 25,
+    "search": 8,
+    "like": 10,
+    "comment": 5,
+    "comments": 5,
+    "profile": 4,
+    "user_pins": 3,
+    "liked_pins": 2,
+    "upload": 2,
+    "login": 1,
+}
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """
+    "detail=50,search=50" → {"detail": 50, "search": 50}
+    """
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"unknown scenario: {name}")
+        mix[name.strip()] = int(weight)
+    return mix
+
+
+class Scenarios:
+    """
+    시나리오 하나 = 사용자 동작 하나 (피드 스크롤은 두 페이지 요청)
+    실패 시 예외 → 오류로 집계
+    """
+
+    def __init__(self, client, rng: random.Random, users: int, pins: int):
+        self.client = client
+        self.rng = rng
+        self.users = users
+        self.pins = pins
+
+    def _user(self) -> int:
+        return self.rng.randint(1, self.users)
+
+    def _pin(self) -> int:
+        return self.rng.randint(1, self.pins)
+
+    async def _get(self, url: str, **params):
+        response = await self.client.get(url, params=params)
+        response.raise_for_status()
+        return response
+
+    async def feed_scroll(self):
+        page = (await self._get("/api/pins/", limit=20)).json()
+        if page.get("next_cursor"):
+            await self._get("/api/pins/", limit=20, cursor=page["next_cursor"])
+
+    async def home_feed(self):
+        await self._get("/api/pins/feed", limit=20)
+
+    async def detail(self):
+        await self._get(f"/api/pins/{self._pin()}")
+
+    async def search(self):
+        await self._get("/api/pins/search", search=self.rng.choice(WORDS))
+
+    async def like(self):
+        response = await self.client.put(f"/api/pins/{self._pin()}/likes", json={"user_id": self._user()})
+        response.raise_for_status()
+
+    async def comment(self):
+        response = await self.client.post(
+            f"/api/pins/{self._pin()}/comments", json={"user_id": self._user(), "content": "bench"}
+        )
+        response.raise_for_status()
+
+    async def comments(self):
+        await self._get(f"/api/pins/{self._pin()}/comments")
+
+    async def profile(self):
+        await self._get(f"/api/users/{self._user()}")
+
+    async def user_pins(self):
+        await self._get(f"/api/users/{self._user()}/pins")
+
+    async def liked_pins(self):
+        await self._get(f"/api/users/{self._user()}/likes")
+
+    async def upload(self):
+        # 매번 다른 이미지가 되도록 GIF 뒤에 바이트 추가
+        body = GIF + self.rng.randbytes(16)
+        response = await self.client.post(
+            "/api/pins/",
+            data={"user_id": self._user(), "title": "bench upload", "content": "bench"},
+            files={"image": ("bench.gif", body, "image/gif")},
+        )
+        response.raise_for_status()
+
+    async def login(self):
+        user = self._user()
+        response = await self.client.post(
+            "/api/users/login", json={"email": f"bench{user}@example.com", "password": PASSWORD}
+        )
+        response.raise_for_status()
+
+
+async def run(app, users: int, pins: int, mix: dict[str, int], clients: int, requests: int, warmup: int, seed: int) -> dict:
+    import httpx
+
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    latencies: dict[str, list[float]] = {name: [] for name in names}
+    errors: dict[str, int] = {name: 0 for name in names}
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60
+    ) as client:
+
+        async def worker(index: int, count: int, record: bool):
+            rng = random.Random(seed * 1000 + index + (0 if record else 500))
+            scenarios = Scenarios(client, rng, users, pins)
+            for name in rng.choices(names, weights, k=count):
+                started = time.perf_counter()
+                try:
+                    await getattr(scenarios, name)()
+                except Exception:
+                    if record:
+                        errors[name] += 1
+                    continue
+                if record:
+                    latencies[name].append(time.perf_counter() - started)
+
+        # 캐시 / 커넥션 풀 / 프로세스 풀 준비
+        await asyncio.gather(*(worker(i, warmup // clients, False) for i in range(clients)))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i, requests // clients, True) for i in range(clients)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "rps": round(sum(len(v) for v in latencies.values()) / elapsed, 1),
+        "errors": errors,
+        "endpoints": summarize({k: v for k, v in latencies.items() if v}, elapsed),
+    }
+
+
+def _environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True, text=True
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", help="bench.seed 로 만든 DB (주지 않으면 임시 DB에 새로 시드)")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--pins", type=int, default=20000)
+    parser.add_argument("--likes", type=int, default=100000)
+    parser.add_argument("--comments", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=300)
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="예: detail=50,search=50")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    output = Path(args.output).resolve() if args.output else None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = f"{tmp}/bench.db"
+        url = f"sqlite:///{path}"
+        os.environ["DATABASE_URL"] = url
+
+        if args.db:
+            # 원본 시드 DB는 건드리지 않도록 복사본 사용
+            shutil.copy(args.db, path)
+        else:
+            migrate(url)
+
+        # 앱은 작업 폴더 기준 src/ 를 마운트하므로 임시 폴더에서 실행
+        os.chdir(tmp)
+        os.makedirs("src", exist_ok=True)
+
+        import database
+        import main as app_main
+
+        if args.db:
+            from sqlalchemy import func, select
+
+            from api.models import Pin, User
+
+            with database.SessionLocal() as db:
+                users = db.execute(select(func.max(User.user_id))).scalar()
+                pins = db.execute(select(func.max(Pin.pin_id))).scalar()
+            dataset = {"users": users, "pins": pins}
+        else:
+            dataset = seed(database, args.users, args.pins, args.likes, args.comments, args.seed)
+            users, pins = args.users, args.pins
+
+        result = asyncio.run(
+            run(app_main.app, users, pins, args.mix, args.clients, args.requests, args.warmup, args.seed)
+        )
+        os.chdir(BASE_DIR)
+
+    report = {
+        "benchmark": "workload",
+        "environment": _environment(),
+        "params": {k: v for k, v in vars(args).items() if k != "output"},
+        "dataset": dataset,
+        **result,
+    }
+    print(json.dumps(report, indent=2))
+    if output:
+        output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
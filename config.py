@@ -0,0 +1,106 @@
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+# --- database ---
+# SQLite만 지원, 기본값은 프로젝트 폴더의 SQLite 파일
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./pinter5t.db")
+# 조회(GET/HEAD) 전용 DB (복제본 등), 비우면 DATABASE_URL 을 읽기 전용 커넥션으로 사용
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL", "")
+# 0이면 조회/쓰기 모두 같은 엔진 사용
+DB_SPLIT_READS = bool(_env_int("DB_SPLIT_READS", 1))
+# 커넥션 풀 (엔진별)
+DB_POOL_SIZE = _env_int("DB_POOL_SIZE", 5)
+DB_MAX_OVERFLOW = _env_int("DB_MAX_OVERFLOW", 10)
+DB_POOL_TIMEOUT = _env_int("DB_POOL_TIMEOUT", 30)
+# SQLite 커넥션 설정 (잠금 대기 ms / mmap bytes / 페이지 캐시 KiB)
+SQLITE_BUSY_TIMEOUT_MS = _env_int("SQLITE_BUSY_TIMEOUT_MS", 15000)
+SQLITE_MMAP_SIZE = _env_int("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)
+SQLITE_CACHE_SIZE_KB = _env_int("SQLITE_CACHE_SIZE_KB", 20 * 1024)
+# 서버 시작 시 DB 스키마가 Alembic head 인지 확인 (0이면 생략)
+DB_SCHEMA_CHECK = bool(_env_int("DB_SCHEMA_CHECK", 1))
+# 서버 시작 시 엔진별로 미리 열어 둘 커넥션 수
+DB_WARM_CONNECTIONS = _env_int("DB_WARM_CONNECTIONS", 2)
+
+# --- password ---
+# pbkdf2_sha256 반복 횟수 (변경 시 다음 로그인 때 자동 재해시)
+PASSWORD_ROUNDS = _env_int("PASSWORD_ROUNDS", 29000)
+# 해시 전용 스레드 수 / 대기열 길이 (초과 시 503)
+PASSWORD_HASH_WORKERS = _env_int("PASSWORD_HASH_WORKERS", 4)
+PASSWORD_HASH_QUEUE_DEPTH = _env_int("PASSWORD_HASH_QUEUE_DEPTH", 64)
+
+# --- upload ---
+# 업로드 이미지 최대 크기 (bytes)
+MAX_UPLOAD_BYTES = _env_int("MAX_UPLOAD_BYTES", 10 * 1024 * 1024)
+
+# --- image variants ---
+# 피드용 리사이즈 이미지 너비(px) / 포맷 / 생성 프로세스 수
+IMAGE_VARIANT_WIDTHS = tuple(
+    int(w) for w in os.getenv("IMAGE_VARIANT_WIDTHS", "236,474,736").split(",")
+)
+IMAGE_VARIANT_FORMAT = os.getenv("IMAGE_VARIANT_FORMAT", "webp") # webp | jpeg
+THUMBNAIL_WORKERS = _env_int("THUMBNAIL_WORKERS", 2)
+
+# --- media (/src) ---
+# 정적 이미지 메타데이터 캐시 크기 / 유효 시간(초)
+MEDIA_CACHE_ENTRIES = _env_int("MEDIA_CACHE_ENTRIES", 4096)
+MEDIA_CACHE_TTL = _env_int("MEDIA_CACHE_TTL", 300)
+
+# --- read cache ---
+# 핀 상세/피드/댓글/프로필 조회 캐시 크기 / 유효 시간(초), 0이면 캐시 사용 안 함
+READ_CACHE_ENTRIES = _env_int("READ_CACHE_ENTRIES", 10000)
+READ_CACHE_TTL = _env_int("READ_CACHE_TTL", 30)
+
+# --- likes ---
+# 1이면 즐겨찾기 추가/취소를 메모리에 모았다가 일괄 반영 (응답 202, 반영까지 최대 flush 간격만큼 지연)
+LIKE_WRITE_BEHIND = bool(_env_int("LIKE_WRITE_BEHIND", 0))
+LIKE_FLUSH_INTERVAL_MS = _env_int("LIKE_FLUSH_INTERVAL_MS", 200)
+LIKE_FLUSH_BATCH = _env_int("LIKE_FLUSH_BATCH", 500)
+
+# --- feed ---
+# 홈 피드 스냅샷 갱신 주기 / 전체 재계산 주기(초)
+FEED_REFRESH_SECONDS = _env_int("FEED_REFRESH_SECONDS", 30)
+FEED_FULL_REFRESH_SECONDS = _env_int("FEED_FULL_REFRESH_SECONDS", 3600)
+# 반응 수가 10배면 이 시간(시간 단위)만큼 먼저 쓴 핀과 같은 점수 / 댓글 1개 = 좋아요 n개
+FEED_DECAY_HOURS = _env_int("FEED_DECAY_HOURS", 12)
+FEED_COMMENT_WEIGHT = _env_int("FEED_COMMENT_WEIGHT", 2)
+
+# --- metrics ---
+# 요청 하나의 쿼리 수가 이보다 많으면 경고 로그 (N+1 의심)
+METRICS_QUERY_WARN_THRESHOLD = _env_int("METRICS_QUERY_WARN_THRESHOLD", 20)
+
+# --- compression ---
+# 이보다 작은 JSON 응답은 압축하지 않음 (바이트)
+COMPRESS_MIN_BYTES = _env_int("COMPRESS_MIN_BYTES", 1024)
+# 동적 응답이라 압축 속도 우선 (gzip 1~9, brotli 0~11)
+GZIP_LEVEL = _env_int("GZIP_LEVEL", 6)
+BROTLI_QUALITY = _env_int("BROTLI_QUALITY", 4)
+
+# --- events (SSE) ---
+# 구독자별 대기 이벤트 수 (넘으면 느린 클라이언트로 보고 연결 종료 → Last-Event-ID 로 재연결)
+EVENTS_QUEUE_SIZE = _env_int("EVENTS_QUEUE_SIZE", 100)
+# 핀별로 재연결용으로 보관할 최근 이벤트 수 / 버퍼를 유지할 최대 핀 수
+EVENTS_BUFFER_SIZE = _env_int("EVENTS_BUFFER_SIZE", 200)
+EVENTS_MAX_PINS = _env_int("EVENTS_MAX_PINS", 10000)
+# 마지막 구독자가 끊긴 뒤 재연결(Last-Event-ID)을 위해 핀 버퍼를 유지하는 시간(초)
+EVENTS_GRACE_SECONDS = _env_int("EVENTS_GRACE_SECONDS", 60)
+# 이벤트가 없을 때 연결 유지용 주석을 보내는 간격 / 클라이언트 재연결 대기 시간
+EVENTS_HEARTBEAT_SECONDS = _env_int("EVENTS_HEARTBEAT_SECONDS", 15)
+EVENTS_RETRY_MS = _env_int("EVENTS_RETRY_MS", 3000)
+
+# --- jobs ---
+# 백그라운드 작업 워커 수 (워커 프로세스별, 0이면 이 프로세스에서는 실행하지 않음) / 대기 작업 확인 간격
+JOBS_WORKERS = _env_int("JOBS_WORKERS", 2)
+JOBS_POLL_INTERVAL_MS = _env_int("JOBS_POLL_INTERVAL_MS", 1000)
+# 최대 시도 횟수 / 재시도 대기(초, 시도마다 2배, 최대값까지)
+JOBS_MAX_ATTEMPTS = _env_int("JOBS_MAX_ATTEMPTS", 5)
+JOBS_BACKOFF_SECONDS = _env_int("JOBS_BACKOFF_SECONDS", 2)
+JOBS_BACKOFF_MAX_SECONDS = _env_int("JOBS_BACKOFF_MAX_SECONDS", 300)
+# 작업 하나의 최대 실행 시간(초), 넘으면 실패 처리 (프로세스가 죽으면 이 시간 뒤 다른 워커가 다시 실행)
+JOBS_LEASE_SECONDS = _env_int("JOBS_LEASE_SECONDS", 300)
+# 끝난 작업(done / failed) 보관 시간(시간)
+JOBS_RETENTION_HOURS = _env_int("JOBS_RETENTION_HOURS", 24)
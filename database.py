@@ -1,39 +1,203 @@
-from typing import Generator
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
+import ast
+import asyncio
+from pathlib import Path
+from typing import AsyncGenerator
+from fastapi import Request
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
-# SQLite DB URL
-SQLALCHEMY_DATABASE_URL = "sqlite:///./pinter5t.db"
+import config
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# DB URL (환경 변수 DATABASE_URL, 기본값 ./pinter5t.db)
+SQLALCHEMY_DATABASE_URL = config.DATABASE_URL
+
+
+def _sqlite_url(url: str) -> URL:
+    """
+    SQLite URL만 허용 (FTS5, BEGIN IMMEDIATE, ON CONFLICT 등 SQLite 전용 기능을 사용)
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        raise ValueError(f"Only SQLite databases are supported, got {parsed.drivername!r}")
+    return parsed
+
+
+def _async_url(url: str) -> str:
+    # 비동기 드라이버(aiosqlite) URL
+    return _sqlite_url(url).set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+
+
+ASYNC_SQLALCHEMY_DATABASE_URL = _async_url(SQLALCHEMY_DATABASE_URL)
+ASYNC_READ_DATABASE_URL = _async_url(config.DATABASE_READ_URL or SQLALCHEMY_DATABASE_URL)
 
-# DB 엔진 생성
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
 
-# 세션 로컬 클래스 생성
+def _engine_options(url: str) -> dict:
+    parsed = make_url(url)
+    options = {"connect_args": {"check_same_thread": False}}
+    # 메모리 DB는 커넥션 하나를 공유하는 풀이라 크기 설정 불가
+    if parsed.database and parsed.database != ":memory:":
+        options.update(
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+        )
+    return options
+
+
+def _configure_sqlite(engine: Engine, read_only: bool = False, immediate: bool = True) -> None:
+    """
+    SQLite 커넥션 설정
+    - WAL: 쓰기 중에도 다른 커넥션/워커가 읽을 수 있음
+    - busy_timeout: 잠금이 풀릴 때까지 대기 ("database is locked" 방지)
+    - foreign_keys: ondelete="CASCADE" 동작
+    - immediate: BEGIN IMMEDIATE로 트랜잭션 시작 시 쓰기 잠금을 잡음
+      (읽은 뒤 쓰기로 올라갈 때 다른 워커와 교착되어 바로 실패하는 것 방지)
+    """
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        # 트랜잭션 시작을 아래 begin 이벤트에서 직접 처리
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        if not read_only:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={config.SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA mmap_size={config.SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size=-{config.SQLITE_CACHE_SIZE_KB}")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE" if immediate and not read_only else "BEGIN")
+
+
+# DB 엔진 생성 (테이블 생성 / 관리 스크립트용 동기 엔진)
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **_engine_options(SQLALCHEMY_DATABASE_URL))
+
+# 세션 로컬 클래스 생성 (동기)
 SessionLocal = sessionmaker(
     autoflush=False, # 쿼리를 날리기 전 자동 flush X
     autocommit=False, # 명시적으로 db.commit()을 해야 함
     bind=engine
 )
 
+# 요청 처리용 비동기 엔진
+# 쿼리가 별도 스레드에서 실행되어 이벤트 루프를 막지 않음
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL, **_engine_options(ASYNC_SQLALCHEMY_DATABASE_URL)
+)
+
+# 조회 전용 비동기 엔진 (GET/HEAD 요청)
+# 별도 URL이 없으면 같은 DB를 읽기 전용 커넥션 풀로 사용 → 쓰기 잠금을 기다리지 않음
+if config.DB_SPLIT_READS:
+    read_async_engine = create_async_engine(
+        ASYNC_READ_DATABASE_URL, **_engine_options(ASYNC_READ_DATABASE_URL)
+    )
+else:
+    read_async_engine = async_engine
+
+_configure_sqlite(engine)
+# 읽기를 분리하지 않으면 조회도 쓰기 엔진을 쓰므로 IMMEDIATE 사용 안 함
+_configure_sqlite(async_engine.sync_engine, immediate=read_async_engine is not async_engine)
+if read_async_engine is not async_engine:
+    _configure_sqlite(read_async_engine.sync_engine, read_only=True)
+
+# 세션 로컬 클래스 생성 (비동기)
+AsyncSessionLocal = async_sessionmaker(
+    autoflush=False,
+    expire_on_commit=False, # commit 후 속성 접근 시 lazy load(I/O) 방지
+    bind=async_engine
+)
+
+# 조회 전용 세션
+ReadSessionLocal = async_sessionmaker(
+    autoflush=False,
+    expire_on_commit=False,
+    bind=read_async_engine
+)
+
 # Base 클래스 생성
 class Base(DeclarativeBase):
     pass
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
-    DB 세션 생성 및 반환
+    비동기 DB 세션 생성 및 반환
+    GET/HEAD 요청은 조회 전용 엔진 사용
     요청 완료 시 자동으로 세션 종료
     """
+    session_factory = ReadSessionLocal if request.method in ("GET", "HEAD") else AsyncSessionLocal
+
+    async with session_factory() as db: # 세션 생성 (종료 시 자동 close)
+        try:
+            yield db # 함수에 DB 세션 전달
+        except:
+            await db.rollback()
+            raise
+
 
-    db = SessionLocal() # 세션 생성
+def _alembic_heads() -> set[str]:
+    """
+    마이그레이션 파일의 revision / down_revision 값으로 head 리비전 계산
+    (alembic ScriptDirectory는 모든 마이그레이션 모듈을 실행하므로 시작이 느려져 파일만 파싱)
+    """
+    revisions, parents = set(), set()
+    for path in (BASE_DIR / "migrations" / "versions").glob("*.py"):
+        values = {}
+        for node in ast.parse(path.read_text()).body:
+            if isinstance(node, (ast.Assign, ast.AnnAssign)) and node.value is not None:
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                for target in targets:
+                    if isinstance(target, ast.Name) and target.id in ("revision", "down_revision"):
+                        values[target.id] = ast.literal_eval(node.value)
+        if "revision" not in values:
+            continue
+        revisions.add(values["revision"])
+        down = values.get("down_revision")
+        parents.update(down if isinstance(down, (tuple, list)) else [down] if down else [])
+    return revisions - parents
 
-    try:
-        yield db # 함수에 DB 세션 전달
-    except:
-        db.rollback()
-        raise
-    finally:
-        db.close() # db 닫기
\ No newline at end of file
+
+def _current_revisions(connection) -> set[str]:
+    if not inspect(connection).has_table("alembic_version"):
+        return set()
+    # 리비전 한 행짜리 테이블이라 풀 스캔 점검 대상에서 제외
+    rows = connection.exec_driver_sql(
+        "SELECT version_num FROM alembic_version", execution_options={"full_scan": True}
+    )
+    return set(rows.scalars())
+
+
+async def check_schema() -> None:
+    """
+    DB 스키마가 Alembic head 인지 확인 (DDL은 실행하지 않음)
+    여러 워커가 동시에 떠도 경쟁 없이 읽기만 하며, 다르면 서버 시작 실패
+    """
+    heads = await asyncio.to_thread(_alembic_heads)
+    async with read_async_engine.connect() as conn:
+        current = await conn.run_sync(_current_revisions)
+
+    if current != heads:
+        raise RuntimeError(
+            f"Database schema is at {sorted(current) or 'an empty database'}, "
+            f"expected Alembic head {sorted(heads)}; run `alembic upgrade head`"
+        )
+
+
+async def warm_up(connections: int) -> None:
+    """
+    엔진별 커넥션을 미리 열어 풀에 넣어 둠 (첫 요청이 연결/PRAGMA 비용을 내지 않도록)
+    """
+    for app_engine in {async_engine, read_async_engine}:
+        # 트랜잭션 없이 연결만 (쓰기 엔진에서 BEGIN IMMEDIATE 잠금을 잡지 않도록)
+        opened = [await app_engine.connect() for _ in range(connections)]
+        for conn in opened:
+            await conn.close()
@@ -1,20 +1,50 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.responses import FileResponse
-from starlette.staticfiles import StaticFiles
+from starlette.responses import FileResponse, PlainTextResponse
 
 from routers import users as users_router
 from routers import pins as pins_router
-from database import Base, engine
-from api import models
+from routers import jobs as jobs_router
+import config
+import database
+from services import events, feed, jobs, likes, passwords, thumbnails
+from services.cache import read_cache
+from services.compression import CompressionMiddleware
+from services.media import MediaFiles
+from services.metrics import MetricsMiddleware, registry as metrics_registry
 
 
 BASE_DIR = Path(__file__).resolve().parent              # backend/
 FRONTEND_DIR = BASE_DIR.parent / "frontend" / "build"   # project-root/frontend/build
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 스키마는 alembic upgrade head 로만 변경하고, 시작 시에는 확인만 함
+    if config.DB_SCHEMA_CHECK:
+        await database.check_schema()
+    await database.warm_up(config.DB_WARM_CONNECTIONS)
+    passwords.preload()
+    # 이전 실행에서 남은 작업도 이어서 처리
+    jobs.pool.start()
+
+    yield
+
+    # 모아 둔 즐겨찾기 반영
+    await likes.buffer.close()
+    feed.snapshot.close()
+    # 열린 SSE 스트림 종료
+    events.hub.close()
+
+    # 작업 풀 정리 (실행 중이던 작업은 대기 상태로 되돌려 다음 실행 때 처리)
+    await jobs.pool.close()
+    thumbnails.worker.shutdown()
+    passwords.shutdown()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="pintere5t",
@@ -22,6 +52,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        lifespan=lifespan,
     )
 
     origins = [
@@ -35,22 +66,37 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Total-Count", "X-Job-Id"], # 댓글 수 (HEAD /pins/:pinId/comments), 핀 이미지 작업 id
     )
 
-    # DB 테이블 생성
-    Base.metadata.create_all(bind=engine)
+    # JSON 응답 압축 (brotli / gzip)
+    app.add_middleware(CompressionMiddleware)
+
+    # 요청 지연시간 / 쿼리 수 계측 (가장 바깥에서 측정하도록 마지막에 추가)
+    app.add_middleware(MetricsMiddleware)
 
     # API 라우터
     app.include_router(users_router.router, prefix="/api")
     app.include_router(pins_router.router, prefix="/api")
+    app.include_router(jobs_router.router, prefix="/api")
     
-    # React 정적 파일 서빙
+    # 업로드 이미지 서빙 (immutable 캐시 + ETag)
     app.mount(
         "/src",                    
-        StaticFiles(directory="src"),  
+        MediaFiles(directory="src"),  
         name="src",
     )    
 
+    # 조회 캐시 통계 (현재 워커 기준)
+    @app.get("/api/cache/stats", include_in_schema=False)
+    async def cache_stats():
+        return read_cache.snapshot()
+
+    # Prometheus 수집용 지표 (현재 워커 기준)
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
     @app.get("/", include_in_schema=False)
     async def index():
         return {
@@ -0,0 +1,41 @@
+"""add pins.like_count, pins.comment_count
+
+Revision ID: a8d4e61f3c95
+Revises: f3c19d7a2b80
+Create Date: 2026-10-18 20:31:47.119802
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d4e61f3c95'
+down_revision: Union[str, Sequence[str], None] = 'f3c19d7a2b80'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('pins', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+
+    # 기존 데이터 채우기 (updated_at 은 유지)
+    op.execute(
+        """
+        UPDATE pins SET
+            like_count = (SELECT COUNT(*) FROM likes WHERE likes.pin_id = pins.pin_id),
+            comment_count = (SELECT COUNT(*) FROM comments WHERE comments.pin_id = pins.pin_id)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('pins', schema=None) as batch_op:
+        batch_op.drop_column('comment_count')
+        batch_op.drop_column('like_count')
@@ -0,0 +1,30 @@
+"""add likes (user_id, created_at, like_id) index
+
+Revision ID: b2f7c03e9d18
+Revises: a8d4e61f3c95
+Create Date: 2026-10-18 20:58:03.640271
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2f7c03e9d18'
+down_revision: Union[str, Sequence[str], None] = 'a8d4e61f3c95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('likes', schema=None) as batch_op:
+        batch_op.create_index('ix_likes_user_id_created_at_like_id', ['user_id', 'created_at', 'like_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('likes', schema=None) as batch_op:
+        batch_op.drop_index('ix_likes_user_id_created_at_like_id')
@@ -0,0 +1,76 @@
+"""add likes, comments and query indexes
+
+Revision ID: b7e2d91c4f3a
+Revises: 6352a43560dc
+Create Date: 2026-10-18 17:40:02.114870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d91c4f3a'
+down_revision: Union[str, Sequence[str], None] = '6352a43560dc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+
+    # create_all로 이미 만들어진 DB는 테이블 생성을 건너뜀
+    if not inspector.has_table('likes'):
+        op.create_table('likes',
+        sa.Column('like_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('pin_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.ForeignKeyConstraint(['pin_id'], ['pins.pin_id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('like_id')
+        )
+        op.create_index(op.f('ix_likes_like_id'), 'likes', ['like_id'], unique=False)
+    else:
+        # 유니크 인덱스 생성 전 중복 즐겨찾기 정리
+        op.execute(
+            "DELETE FROM likes WHERE like_id NOT IN "
+            "(SELECT MIN(like_id) FROM likes GROUP BY user_id, pin_id)"
+        )
+
+    if not inspector.has_table('comments'):
+        op.create_table('comments',
+        sa.Column('comment_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('pin_id', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.ForeignKeyConstraint(['pin_id'], ['pins.pin_id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('comment_id')
+        )
+        op.create_index(op.f('ix_comments_comment_id'), 'comments', ['comment_id'], unique=False)
+
+    op.create_index('ix_pins_updated_at_pin_id', 'pins', ['updated_at', 'pin_id'], unique=False)
+    op.create_index('ix_pins_user_id_updated_at_pin_id', 'pins', ['user_id', 'updated_at', 'pin_id'], unique=False)
+    op.create_index('uq_likes_user_id_pin_id', 'likes', ['user_id', 'pin_id'], unique=True)
+    op.create_index('ix_likes_pin_id', 'likes', ['pin_id'], unique=False)
+    op.create_index('ix_comments_pin_id_created_at', 'comments', ['pin_id', 'created_at', 'comment_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_comments_pin_id_created_at', table_name='comments')
+    op.drop_index('ix_likes_pin_id', table_name='likes')
+    op.drop_index('uq_likes_user_id_pin_id', table_name='likes')
+    op.drop_index('ix_pins_user_id_updated_at_pin_id', table_name='pins')
+    op.drop_index('ix_pins_updated_at_pin_id', table_name='pins')
+    op.drop_index(op.f('ix_comments_comment_id'), table_name='comments')
+    op.drop_table('comments')
+    op.drop_index(op.f('ix_likes_like_id'), table_name='likes')
+    op.drop_table('likes')
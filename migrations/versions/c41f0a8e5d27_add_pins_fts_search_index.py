@@ -0,0 +1,34 @@
+"""add pins_fts search index
+
+Revision ID: c41f0a8e5d27
+Revises: b7e2d91c4f3a
+Create Date: 2026-10-18 18:05:47.530211
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f0a8e5d27'
+down_revision: Union[str, Sequence[str], None] = 'b7e2d91c4f3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS pins_fts "
+        "USING fts5(title, content, tokenize = 'unicode61 remove_diacritics 2')"
+    )
+    # 기존 핀 색인
+    op.execute("DELETE FROM pins_fts")
+    op.execute("INSERT INTO pins_fts (rowid, title, content) SELECT pin_id, title, content FROM pins")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TABLE IF EXISTS pins_fts")
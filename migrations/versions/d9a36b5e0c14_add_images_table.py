@@ -0,0 +1,39 @@
+"""add images table
+
+Revision ID: d9a36b5e0c14
+Revises: c41f0a8e5d27
+Create Date: 2026-10-18 18:42:11.806395
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a36b5e0c14'
+down_revision: Union[str, Sequence[str], None] = 'c41f0a8e5d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('images',
+    sa.Column('digest', sa.String(length=64), nullable=False),
+    sa.Column('path', sa.String(length=255), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('ref_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('digest'),
+    sa.UniqueConstraint('path')
+    )
+    op.create_index('ix_pins_image', 'pins', ['image'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_pins_image', table_name='pins')
+    op.drop_table('images')
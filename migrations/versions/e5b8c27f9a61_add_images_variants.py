@@ -0,0 +1,30 @@
+"""add images.variants
+
+Revision ID: e5b8c27f9a61
+Revises: d9a36b5e0c14
+Create Date: 2026-10-18 19:10:35.271946
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8c27f9a61'
+down_revision: Union[str, Sequence[str], None] = 'd9a36b5e0c14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('images', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('variants', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('images', schema=None) as batch_op:
+        batch_op.drop_column('variants')
@@ -0,0 +1,38 @@
+"""add cache_invalidations
+
+Revision ID: f3c19d7a2b80
+Revises: e5b8c27f9a61
+Create Date: 2026-10-18 20:02:11.508317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c19d7a2b80'
+down_revision: Union[str, Sequence[str], None] = 'e5b8c27f9a61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'cache_invalidations',
+        sa.Column('scope', sa.String(length=64), nullable=False),
+        sa.Column('seq', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('scope'),
+    )
+    with op.batch_alter_table('cache_invalidations', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_cache_invalidations_seq'), ['seq'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('cache_invalidations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_cache_invalidations_seq'))
+
+    op.drop_table('cache_invalidations')
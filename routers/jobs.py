@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import get_db
+from api.models import Job
+import schemas
+
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+# --- Routes ---
+# 백그라운드 작업 상태 (핀 등록/수정 응답의 X-Job-Id)
+@router.get("/{job_id}", response_model=schemas.JobResponse)
+async def get_job(job_id: int, db: AsyncSession = Depends(get_db)):
+    job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return job
@@ -1,10 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, Form, File
-from sqlalchemy.orm import Session
-from sqlalchemy import select
-import uuid, os
-
-from database import get_db
-from api.models import Pin, Like, Comment
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, UploadFile, Form, File, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, select
+
+from database import ReadSessionLocal, get_db
+from api.models import Pin, Comment, Image
+from services.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    paginate,
+)
+from services import counters
+from services import events
+from services import feed
+from services import images as image_store
+from services import jobs
+from services import likes
+from services import search as search_index
+from services.batch import batch_ids, ordered
+from services.cache import read_cache
+from services.serialization import COMMENT_COLUMNS, PIN_VIEWS, FastJSONResponse, comment_item, conditional_response, encode
+from services.uploads import StoredImage, save_upload
+import config
 import schemas
 
 router = APIRouter(prefix="/pins", tags=["pins"])
@@ -13,44 +35,43 @@ router = APIRouter(prefix="/pins", tags=["pins"])
 # 핀 생성
 @router.post("/", response_model = schemas.PinResponse, status_code = status.HTTP_201_CREATED)
 async def create_pin(
+    response: Response,
     user_id: int = Form(...),
     title: str = Form(...),
     content: str = Form(...),
     image: UploadFile | None = File(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):  
-    image_url: str | None = None
-    # 이미지 저장 처리
+    stored = None
+    # 이미지 저장 처리 (src 폴더에 내용 해시 이름으로 저장, 중복 제거)
     if image is not None and image.filename:
-        # 확장자 추출
-        ext = image.filename.split(".")[-1]
-        
-        # 파일명 생성
-        filename = f"{uuid.uuid4()}.{ext}"
-
-        #src 폴더에 저장
-        save_dir = "src"
-        os.makedirs(save_dir, exist_ok=True)
-        file_path = os.path.join(save_dir, filename)
-
-        with open(file_path, "wb") as buffer:
-            buffer.write(await image.read())
-
-        image_url = f"/src/{filename}"
+        stored = await save_upload(image)
 
     # DTO 생성  
     pin_data = schemas.PinCreate(
         user_id=user_id,
         title=title,
         content=content,
-        image=image_url,
+        image=stored.url if stored else None,
     )
 
     new_pin = Pin(**pin_data.model_dump())
 
     db.add(new_pin)
-    db.commit()
-    db.refresh(new_pin)
+    await db.flush() # pin_id 발급
+    if stored:
+        await image_store.acquire(db, stored)
+    await search_index.index_pin(db, new_pin)
+    # pin:{id} 는 삭제된 핀의 id가 재사용될 때를 위해 함께 올림 (홈 피드 갱신 대상)
+    await read_cache.bump(db, "feed:head", f"pin:{new_pin.pin_id}")
+    # 리사이즈 이미지는 응답 후 작업 큐에서 생성 (핀과 같은 트랜잭션으로 등록)
+    if stored:
+        await _enqueue_thumbnails(db, stored, response)
+    await db.flush()
+    await db.refresh(new_pin) # 커밋 전에 서버 기본값(created_at 등) 로드
+    await db.commit()
+    if stored:
+        jobs.pool.wake()
 
     return new_pin
     
@@ -58,14 +79,21 @@ async def create_pin(
 @router.put("/{pin_id}", response_model = schemas.PinResponse)
 async def update_pin(
     pin_id: int,
+    response: Response,
     user_id: int = Form(...),
     title: str | None = Form(None),
     content: str | None =  Form(None),
     image: UploadFile | None = File(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):  
+    # 업로드 저장은 트랜잭션(쓰기 잠금) 시작 전에 처리
+    # (핀이 없거나 권한이 없으면 저장된 파일은 GC가 정리)
+    stored = None
+    if image is not None and image.filename:
+        stored = await save_upload(image)
+
     # 수정 대상 핀 조회
-    pin = db.get(Pin, pin_id)
+    pin = await db.get(Pin, pin_id)
     if not pin:
         raise HTTPException(status_code=404, detail="Pin not found")
     
@@ -79,84 +107,221 @@ async def update_pin(
     if content is not None:
         pin.content = content
     
-    if image is not None and image.filename:
-        ext = image.filename.split(".")[-1]
-        filename = f"{uuid.uuid4()}.{ext}"
-
-        save_dir = "src"
-        os.makedirs(save_dir, exist_ok=True)
-
-        file_path = os.path.join(save_dir , filename)
-
-        with open(file_path, "wb") as buffer:
-            buffer.write(await image.read())
-
-        pin.image = f"/src/{filename}"
-
-    db.commit()
-    db.refresh(pin)
+    if stored:
+        if stored.url != pin.image:
+            # 이전 이미지 참조 해제 (파일은 GC가 정리)
+            await image_store.acquire(db, stored)
+            await image_store.release(db, pin.image)
+            pin.image = stored.url
+
+    await search_index.index_pin(db, pin)
+    # 수정된 핀은 피드 첫 페이지로 이동
+    await read_cache.bump(db, f"pin:{pin_id}", "feed:head")
+    if stored:
+        await _enqueue_thumbnails(db, stored, response)
+    await db.flush()
+    await db.refresh(pin)
+    await db.commit()
+    if stored:
+        jobs.pool.wake()
 
     return pin  
     
+async def _enqueue_thumbnails(db: AsyncSession, stored: StoredImage, response: Response) -> None:
+    # 키는 images 행 단위 (GC로 지워졌다 다시 올라온 이미지는 새 작업)
+    # 아직 리사이즈가 없으면 끝난(실패 등) 작업도 다시 실행 (진행 상황은 GET /api/jobs/{X-Job-Id})
+    image = (
+        await db.execute(
+            select(Image.created_at, Image.variants).where(Image.digest == stored.digest)
+        )
+    ).first()
+    if image is None:
+        return
+    job_id = await jobs.enqueue(
+        db,
+        "thumbnails.generate",
+        {"url": stored.url, "digest": stored.digest},
+        key=f"thumbnails:{stored.digest}:{image.created_at:%Y%m%d%H%M%S}",
+        requeue=image.variants is None,
+    )
+    response.headers["X-Job-Id"] = str(job_id)
+
 # 핀 삭제
 @router.delete("/{pin_id}")
 async def delete_pin(
     pin_id: int,
     payload: schemas.PinDelete,   
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    pin = db.get(Pin, pin_id)
+    pin = await db.get(Pin, pin_id)
     if not pin:
         raise HTTPException(status_code=404, detail="Pin not found")
 
     if pin.user_id != payload.user_id:
         raise HTTPException(status_code=403, detail="Not allowed to delete this pin")
 
-    db.delete(pin)
-    db.commit()
+    await search_index.remove_pin(db, pin_id)
+    await image_store.release(db, pin.image)
+    await read_cache.bump(db, f"pin:{pin_id}", f"comments:{pin_id}")
+    await db.delete(pin)
+    await db.commit()
 
     return {"message": "Pin deleted successfully"}
 
 
-#핀 검색
-@router.get("/search", response_model = list[schemas.PinResponse])
+#핀 검색 (FTS5 + BM25 랭킹, 커서 기반 페이지네이션)
+# 목록 API는 ?view=summary 면 그리드용 요약(PinSummary)만 응답
+@router.get("/search", response_model = schemas.Page[schemas.PinResponse | schemas.PinSummary])
 async def search_pins(
     search: str,
-    db: Session = Depends(get_db)
+    recency: float = Query(0.0, ge=0.0, le=10.0),
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: schemas.PinView = "full",
+    db: AsyncSession = Depends(get_db)
 ):
-    if not search:
+    match = search_index.build_match(search)
+    if not match:
         raise HTTPException(status_code=400, detail="Search keyword is required")
-    
-    stmt = (
-        select(Pin)
-        .where(Pin.title.like(f"%{search}%"))
-        .order_by(Pin.updated_at.desc())
-    )
 
-    pins = db.execute(stmt).scalars().all()
-    return pins
+    # 페이지가 넘어가도 점수가 변하지 않도록 기준 시각을 커서에 유지
+    if cursor:
+        score, last_id, now = decode_cursor(cursor, float, int, datetime)
+        after = [score, last_id]
+    else:
+        now, after = search_index.now_text(), None
+
+    columns, to_item = PIN_VIEWS[view]
+    stmt = search_index.search_statement(match, recency, now, after, limit, columns())
+    rows = (await db.execute(stmt)).all()
+
+    page = paginate(rows, limit, lambda row: (row.score, row.pin_id, now))
+    page["items"] = [to_item(row) for row in page["items"]]
+    return FastJSONResponse(page)
     
+# 홈 피드 (최근성 + 좋아요/댓글 반응 순위, 스냅샷 기반 커서 페이지네이션)
+# 조회 API는 ETag를 붙이고, If-None-Match 가 같으면 본문 없이 304
+@router.get("/feed", response_model = schemas.Page[schemas.PinResponse | schemas.PinSummary])
+async def home_feed(
+    request: Request,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: schemas.PinView = "full",
+    db: AsyncSession = Depends(get_db),
+):
+    after = tuple(decode_cursor(cursor, float, int)) if cursor else None
+    ranked, has_more = await feed.snapshot.page(after, limit)
+
+    columns, to_item = PIN_VIEWS[view]
+    pins = {}
+    if ranked:
+        rows = await db.execute(
+            select(*columns()).where(Pin.pin_id.in_([pin_id for _, pin_id in ranked]))
+        )
+        pins = {row.pin_id: to_item(row) for row in rows}
+
+    # 스냅샷 이후 삭제된 핀은 건너뜀
+    return conditional_response(request, encode({
+        "items": [pins[pin_id] for _, pin_id in ranked if pin_id in pins],
+        "next_cursor": encode_cursor(*ranked[-1]) if has_more else None,
+    }))
+
+# 핀 여러 개 조회 (?ids=1&ids=2, 캐시에 없는 핀만 한 번의 IN 쿼리로 조회)
+@router.get("/batch", response_model = schemas.Batch[schemas.PinResponse])
+async def get_pins_batch(
+    ids: list[int] = Depends(batch_ids),
+    db: AsyncSession = Depends(get_db),
+):
+    cached = {pin_id: await read_cache.get(f"pin:{pin_id}") for pin_id in ids}
+    misses = [pin_id for pin_id, pin in cached.items() if pin is None]
+
+    if misses:
+        token = read_cache.token()
+        rows = (await db.execute(select(Pin).where(Pin.pin_id.in_(misses)))).scalars()
+        for pin in rows:
+            result = schemas.PinResponse.model_validate(pin)
+            read_cache.set(f"pin:{pin.pin_id}", result, {f"pin:{pin.pin_id}"}, token)
+            cached[pin.pin_id] = result
+
+    return ordered(ids, (pin for pin in cached.values() if pin is not None), lambda pin: pin.pin_id)
+
+# 핀 좋아요/댓글 수만 여러 개 조회 (목록 화면 숫자 갱신용)
+@router.get("/counts", response_model = schemas.Batch[schemas.PinCounts])
+async def get_pin_counts(
+    ids: list[int] = Depends(batch_ids),
+    db: AsyncSession = Depends(get_db),
+):
+    rows = (
+        await db.execute(
+            select(Pin.pin_id, Pin.like_count, Pin.comment_count).where(Pin.pin_id.in_(ids))
+        )
+    ).all()
+    return ordered(ids, rows, lambda row: row.pin_id)
+
 # 핀 상세보기
 @router.get("/{pin_id}", response_model = schemas.PinResponse)
 async def get_pin_detail(
     pin_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_db)
 ):
-    pin = db.get(Pin, pin_id)
+    # 캐시 적중 시 쿼리/직렬화 없이 ETag 비교 (pin:{id} 키는 일괄 조회용 객체 캐시)
+    cache_key = f"pin:{pin_id}:json"
+    cached = await read_cache.get(cache_key)
+    if cached is not None:
+        return conditional_response(request, cached)
+    token = read_cache.token()
+
+    pin = await db.get(Pin, pin_id)
 
     if not pin:
         raise HTTPException(status_code=404, detail="Pin not found")
     
-    return pin
+    result = encode(schemas.PinResponse.model_validate(pin).model_dump())
+    read_cache.set(cache_key, result, {f"pin:{pin_id}"}, token)
+    return conditional_response(request, result)
 
 
     
-# 전체 핀 조회
-@router.get("/", response_model = list[schemas.PinResponse])
-async def list_pins(db: Session = Depends(get_db)):
-    stmt = select(Pin).order_by(Pin.updated_at.desc())
-    pins = db.execute(stmt).scalars().all()
-    return pins
+# 전체 핀 조회 (커서 기반 페이지네이션)
+@router.get("/", response_model = schemas.Page[schemas.PinResponse | schemas.PinSummary])
+async def list_pins(
+    request: Request,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: schemas.PinView = "full",
+    db: AsyncSession = Depends(get_db),
+):
+    # 캐시에는 인코딩된 응답 본문 + ETag를 저장
+    cache_key = f"feed:{view}:{cursor or ''}:{limit}"
+    cached = await read_cache.get(cache_key)
+    if cached is not None:
+        return conditional_response(request, cached)
+    token = read_cache.token()
+
+    columns, to_item = PIN_VIEWS[view]
+    # 요약 응답에는 updated_at 이 없으므로 커서용으로 따로 조회
+    stmt = (
+        select(*columns(), Pin.updated_at.label("sort_at"))
+        .order_by(Pin.updated_at.desc(), Pin.pin_id.desc())
+    )
+    if cursor:
+        stmt = stmt.where(
+            keyset_after((Pin.updated_at, Pin.pin_id), decode_cursor(cursor, datetime, int))
+        )
+
+    rows = (await db.execute(stmt.limit(limit + 1))).all()
+    page = paginate(rows, limit, lambda row: (row.sort_at, row.pin_id))
+    page["items"] = [to_item(row) for row in page["items"]]
+
+    # 새 핀은 첫 페이지에만 나타나므로 feed:head 는 첫 페이지만 구독
+    # 페이지에 포함된 핀이 바뀌거나 삭제되면 해당 페이지 무효화
+    scopes = {f"pin:{item['pin_id']}" for item in page["items"]}
+    if not cursor:
+        scopes.add("feed:head")
+    result = encode(page)
+    read_cache.set(cache_key, result, scopes, token)
+    return conditional_response(request, result)
 
 
 
@@ -165,33 +330,59 @@ async def list_pins(db: Session = Depends(get_db)):
 async def create_like(
     pin_id: int,
     payload: schemas.LikeIn,        
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    user_id = payload.user_id
-    # 핀 존재 여부 확인
-    pin = db.get(Pin, pin_id)
-    if not pin:
-        raise HTTPException(status_code=404, detail="Pin not found")
-    
-    # 즐겨찾기 중복 체크
-    existing_like = (
-        db.query(Like)
-        .filter(Like.user_id == user_id, Like.pin_id == pin_id)
-        .first()
-    )
-    if existing_like:
+    # 중복은 유니크 인덱스 + ON CONFLICT DO NOTHING 으로 판단 (동시 요청도 한 번만 등록)
+    new_like = await likes.like(db, payload.user_id, pin_id)
+    if new_like is None:
+        if not await likes.pin_exists(db, pin_id):
+            raise HTTPException(status_code=404, detail="Pin not found")
         raise HTTPException(status_code=409, detail="Already liked")
 
-    new_like = Like(
-        user_id=user_id,
-        pin_id=pin_id,
-    )
+    await db.commit()
+    events.hub.publish(pin_id, "like.created", {"pin_id": pin_id, "user_id": payload.user_id})
+
+    return new_like._asdict()
+
+
+# 즐겨찾기 추가 / 취소 (멱등, 이미 같은 상태면 그대로 성공)
+# LIKE_WRITE_BEHIND 모드에서는 모아서 반영하므로 202 응답
+@router.put("/{pin_id}/likes", response_model=schemas.LikeState)
+async def put_like(
+    pin_id: int,
+    payload: schemas.LikeIn,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+):
+    return await _set_like(pin_id, payload.user_id, True, response, db)
+
+
+@router.delete("/{pin_id}/likes", response_model=schemas.LikeState)
+async def delete_like(
+    pin_id: int,
+    payload: schemas.LikeIn,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+):
+    return await _set_like(pin_id, payload.user_id, False, response, db)
+
+
+async def _set_like(pin_id: int, user_id: int, liked: bool, response: Response, db: AsyncSession):
+    state = {"user_id": user_id, "pin_id": pin_id, "liked": liked}
 
-    db.add(new_like)
-    db.commit()
-    db.refresh(new_like)
+    if config.LIKE_WRITE_BEHIND:
+        await likes.buffer.submit(user_id, pin_id, liked)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return state
 
-    return new_like
+    changed = await (likes.like if liked else likes.unlike)(db, user_id, pin_id)
+    if not changed and not await likes.pin_exists(db, pin_id):
+        raise HTTPException(status_code=404, detail="Pin not found")
+
+    await db.commit()
+    if changed:
+        events.hub.publish(pin_id, "like.created" if liked else "like.deleted", {"pin_id": pin_id, "user_id": user_id})
+    return state
     
 
 # 댓글 등록
@@ -199,9 +390,9 @@ async def create_like(
 async def create_comment(
     pin_id: int,
     payload: schemas.CommentCreate,   
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    pin = db.get(Pin, pin_id)
+    pin = await db.get(Pin, pin_id)
     if not pin:
         raise HTTPException(status_code=404, detail="Pin not found")
 
@@ -212,39 +403,102 @@ async def create_comment(
     )
 
     db.add(new_comment)
-    db.commit()
-    db.refresh(new_comment)
+    await counters.adjust(db, pin_id, comments=1)
+    await read_cache.bump(db, f"comments:{pin_id}", f"pin:{pin_id}")
+    await db.flush()
+    await db.refresh(new_comment)
+    await db.commit()
+    events.hub.publish(pin_id, "comment.created", schemas.CommentResponse.model_validate(new_comment).model_dump())
 
     return new_comment
 
-# 댓글 불러오기
-@router.get("/{pin_id}/comments", response_model=list[schemas.CommentResponse])
+# 댓글 불러오기 (커서 기반 페이지네이션, order=oldest 오래된 순 / newest 최신순)
+@router.get("/{pin_id}/comments", response_model=schemas.Page[schemas.CommentResponse])
 async def list_comments(
     pin_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    order: schemas.CommentOrder = "oldest",
+    db: AsyncSession = Depends(get_db),
 ):
-    # 핀 존재 여부 체크
-    pin = db.get(Pin, pin_id)
-    if not pin:
+    cache_key = f"comments:{pin_id}:{order}:{cursor or ''}:{limit}"
+    cached = await read_cache.get(cache_key)
+    if cached is not None:
+        return conditional_response(request, cached)
+    token = read_cache.token()
+
+    newest = order == "newest"
+    join_on = Comment.pin_id == Pin.pin_id
+    if cursor:
+        join_on = and_(join_on, keyset_after(
+            (Comment.created_at, Comment.comment_id), decode_cursor(cursor, datetime, int), descending=newest
+        ))
+    sort = (Comment.created_at, Comment.comment_id)
+
+    # 핀 존재 여부도 같은 쿼리로 확인 (핀 LEFT JOIN 댓글: 행이 없으면 404, 댓글이 없으면 NULL 한 행)
+    rows = (
+        await db.execute(
+            select(*COMMENT_COLUMNS)
+            .select_from(Pin)
+            .outerjoin(Comment, join_on)
+            .where(Pin.pin_id == pin_id)
+            .order_by(*(column.desc() if newest else column.asc() for column in sort))
+            .limit(limit + 1)
+        )
+    ).all()
+    if not rows:
         raise HTTPException(status_code=404, detail="Pin not found")
+    if rows[0].comment_id is None:
+        rows = []
 
-    comments = (
-        db.query(Comment)
-        .filter(Comment.pin_id == pin_id)
-        .order_by(Comment.created_at.asc())
-        .all()
-    )
+    page = paginate(rows, limit, lambda row: (row.created_at, row.comment_id))
+    page["items"] = [comment_item(row) for row in page["items"]]
 
-    return comments
+    result = encode(page)
+    read_cache.set(cache_key, result, {f"comments:{pin_id}"}, token)
+    return conditional_response(request, result)
+
+# 댓글 수 (본문 없이 X-Total-Count 헤더로 응답, 댓글은 조회하지 않음)
+@router.head("/{pin_id}/comments")
+async def count_comments(
+    pin_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    count = (
+        await db.execute(select(Pin.comment_count).where(Pin.pin_id == pin_id))
+    ).scalar_one_or_none()
+    if count is None:
+        raise HTTPException(status_code=404, detail="Pin not found")
+
+    return Response(headers={"X-Total-Count": str(count)})
+
+# 댓글 / 좋아요 실시간 스트림 (SSE, 끊기면 Last-Event-ID 로 이어받음)
+@router.get("/{pin_id}/events")
+async def pin_events(
+    pin_id: int,
+    request: Request,
+):
+    # 스트림 동안 읽기 트랜잭션을 잡고 있지 않도록 존재 확인만 짧은 세션으로
+    async with ReadSessionLocal() as db:
+        exists = (await db.execute(select(Pin.pin_id).where(Pin.pin_id == pin_id))).first()
+    if exists is None:
+        raise HTTPException(status_code=404, detail="Pin not found")
+
+    return StreamingResponse(
+        events.hub.stream(pin_id, request.headers.get("last-event-id")),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 # 댓글 수정
 @router.put("/comments/{comment_id}", response_model=schemas.CommentResponse)
 async def update_comment(
     comment_id: int,
     payload: schemas.CommentUpdate,   
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    comment = db.get(Comment, comment_id)
+    comment = await db.get(Comment, comment_id)
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
 
@@ -253,8 +507,11 @@ async def update_comment(
 
     comment.content = payload.content
 
-    db.commit()
-    db.refresh(comment)
+    await read_cache.bump(db, f"comments:{comment.pin_id}")
+    await db.flush()
+    await db.refresh(comment)
+    await db.commit()
+    events.hub.publish(comment.pin_id, "comment.updated", schemas.CommentResponse.model_validate(comment).model_dump())
 
     return comment
 
@@ -265,16 +522,19 @@ async def update_comment(
 async def delete_comment(
     comment_id: int,
     payload: schemas.CommentDelete,  
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    comment = db.get(Comment, comment_id)
+    comment = await db.get(Comment, comment_id)
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
 
     if comment.user_id != payload.user_id:
         raise HTTPException(status_code=403, detail="Not allowed to delete this comment")
 
-    db.delete(comment)
-    db.commit()
+    await counters.adjust(db, comment.pin_id, comments=-1)
+    await read_cache.bump(db, f"comments:{comment.pin_id}", f"pin:{comment.pin_id}")
+    await db.delete(comment)
+    await db.commit()
+    events.hub.publish(comment.pin_id, "comment.deleted", {"comment_id": comment_id, "pin_id": comment.pin_id})
 
     return {"message": "Comment deleted successfully"}
\ No newline at end of file
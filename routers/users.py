@@ -1,91 +1,132 @@
-from fastapi import APIRouter, HTTPException, Depends
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
 from api.models import User, Pin, Like
+from services.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    keyset_after,
+    paginate,
+)
+from services.batch import batch_ids, ordered
+from services.cache import read_cache
+from services.serialization import PIN_VIEWS, FastJSONResponse
+from services.passwords import hash_password, verify_password
 import schemas
 
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-# --- Password Utils ---
-#from passlib.context import CryptContext
-#_pwd = CryptContext(schemes=["bcrypt_sha256"], deprecated="auto")
-from passlib.context import CryptContext
-
-# bcrypt 대신 pbkdf2_sha256 사용
-_pwd = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto",
-)
-# 해시
-def _hash_password(pw: str) -> str:
-    return _pwd.hash(pw)
-
-# 검증
-def _verify_password(pw: str, hashed: str) -> bool:
-    return _pwd.verify(pw, hashed)
-
-
 # --- Routes --- 
 # 회원가입
 @router.post("/signup", response_model=schemas.UserOut, status_code=201)
-async def signup(payload: schemas.SignUpIn, db: Session = Depends(get_db)):
+async def signup(payload: schemas.SignUpIn, db: AsyncSession = Depends(get_db)):
+    # 해시는 트랜잭션(쓰기 잠금) 시작 전에 계산
+    password_hash = await hash_password(payload.password)
+
     # 이메일 중복 확인
     # 유효성 검사 생략
-    exists = db.execute(
+    exists = (await db.execute(
         select(User).where((User.email == payload.email))
-    ).scalar_one_or_none()
+    )).scalar_one_or_none()
     if exists:
         raise HTTPException(status_code=409, detail="Email already exists")
 
     user = User(
         email = payload.email,
-        password_hash = _hash_password(payload.password),
+        password_hash = password_hash,
         username = payload.username,
     )
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.flush()
+    await db.refresh(user) # 커밋 전에 서버 기본값(created_at 등) 로드
+    await db.commit()
 
     return user
 
 # 로그인
 # todo: jwt 도입
 @router.post("/login")
-async def login(payload: schemas.LoginIn, db: Session = Depends(get_db)):
-    user = db.execute(select(User).where(User.email == payload.email)).scalar_one_or_none()
-    if not user or not _verify_password(payload.password, user.password_hash):
+async def login(payload: schemas.LoginIn, db: AsyncSession = Depends(get_db)):
+    user = (await db.execute(select(User).where(User.email == payload.email))).scalar_one_or_none()
+    if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
+    # 해시 검증 동안 쓰기 잠금을 잡고 있지 않도록 조회 트랜잭션 종료
+    await db.commit()
+
+    verified, new_hash = await verify_password(payload.password, user.password_hash)
+    if not verified:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    # 해시 파라미터(반복 횟수)가 바뀐 경우 로그인 시 재해시
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
 
     return {"message": "login ok", "user_id": user.user_id}
 
+# 프로필 여러 개 조회 (?ids=1&ids=2, 핀 작성자 표시용)
+@router.get("/batch", response_model=schemas.Batch[schemas.UserOut])
+async def get_users_batch(ids: list[int] = Depends(batch_ids), db: AsyncSession = Depends(get_db)):
+    users = (await db.execute(select(User).where(User.user_id.in_(ids)))).scalars()
+    return ordered(ids, users, lambda user: user.user_id)
+
 # 프로필 조회
 # todo: 인증 + 권한 체크 e.g. 나 자신 or 공개 프로필만
 @router.get("/{user_id}", response_model=schemas.UserOut)
-async def profile(user_id: int, db: Session = Depends(get_db)):
-    user = db.get(User, user_id)
+async def profile(user_id: int, db: AsyncSession = Depends(get_db)):
+    cache_key = f"user:{user_id}"
+    cached = await read_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    token = read_cache.token()
+
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return user
-
-# 핀 목록
-# todo: Pin 모델/관계 설정 후 구현
-@router.get("/{user_id}/pins")
-async def get_my_pins(user_id: int, db: Session = Depends(get_db)):
-    pins = db.execute(
-        select(Pin).where(Pin.user_id == user_id)
-    ).scalars().all()
+    result = schemas.UserOut.model_validate(user)
+    read_cache.set(cache_key, result, {cache_key}, token)
+    return result
+
+# 핀 목록 (커서 기반 페이지네이션)
+# ?view=summary 면 그리드용 요약(PinSummary)만 응답
+@router.get("/{user_id}/pins", response_model=schemas.Page[schemas.PinResponse | schemas.PinSummary])
+async def get_my_pins(
+    user_id: int,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: schemas.PinView = "full",
+    db: AsyncSession = Depends(get_db),
+):
+    columns, to_item = PIN_VIEWS[view]
+    stmt = (
+        select(*columns(), Pin.updated_at.label("sort_at"))
+        .where(Pin.user_id == user_id)
+        .order_by(Pin.updated_at.desc(), Pin.pin_id.desc())
+    )
+    if cursor:
+        stmt = stmt.where(
+            keyset_after((Pin.updated_at, Pin.pin_id), decode_cursor(cursor, datetime, int))
+        )
 
-    return pins
+    rows = (await db.execute(stmt.limit(limit + 1))).all()
+    page = paginate(rows, limit, lambda row: (row.sort_at, row.pin_id))
+    page["items"] = [to_item(row) for row in page["items"]]
+    return FastJSONResponse(page)
 
 # 프로필 수정
 # todo: 권한 체크
 @router.put("/{user_id}", response_model=schemas.UserOut)
-async def update_profile(user_id: int, payload: schemas.UserUpdateIn, db: Session = Depends(get_db)):
-    user = db.get(User, user_id)
+async def update_profile(user_id: int, payload: schemas.UserUpdateIn, db: AsyncSession = Depends(get_db)):
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -93,26 +134,70 @@ async def update_profile(user_id: int, payload: schemas.UserUpdateIn, db: Sessio
     if "username" in update_data:
         user.username = update_data["username"]
 
-    db.commit()
-    db.refresh(user)
+    await read_cache.bump(db, f"user:{user_id}")
+    await db.flush()
+    await db.refresh(user)
+    await db.commit()
 
     return user
 
 
-# 즐겨찾기한 핀 보기
-@router.get("/{user_id}/likes", response_model=list[schemas.PinResponse])
+# 즐겨찾기한 핀 보기 (즐겨찾기한 순서, 커서 기반 페이지네이션)
+@router.get("/{user_id}/likes", response_model=schemas.Page[schemas.PinResponse | schemas.PinSummary])
 async def get_likes(
     user_id: int,
-    db: Session = Depends(get_db)
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: schemas.PinView = "full",
+    db: AsyncSession = Depends(get_db)
 ):
-    
-    likes = db.query(Like).filter(Like.user_id == user_id).all()
+    columns, to_item = PIN_VIEWS[view]
+    stmt = (
+        select(*columns(), Like.created_at.label("liked_at"), Like.like_id)
+        .join(Like, Like.pin_id == Pin.pin_id)
+        .where(Like.user_id == user_id)
+        .order_by(Like.created_at.desc(), Like.like_id.desc())
+    )
+    if cursor:
+        stmt = stmt.where(
+            keyset_after((Like.created_at, Like.like_id), decode_cursor(cursor, datetime, int))
+        )
 
-    if not likes:
-        return []
-    
-    pin_ids = [like.pin_id for like in likes]
+    rows = (await db.execute(stmt.limit(limit + 1))).all()
+    page = paginate(rows, limit, lambda row: (row.liked_at, row.like_id))
+    page["items"] = [to_item(row) for row in page["items"]]
+    return FastJSONResponse(page)
 
-    pins = db.query(Pin).filter(Pin.pin_id.in_(pin_ids)).all()
 
-    return pins
\ No newline at end of file
+# 즐겨찾기한 핀 id 목록
+# pin_ids 를 주면 그중 즐겨찾기한 id만 반환 (목록 화면의 좋아요 여부 일괄 확인용)
+@router.get("/{user_id}/likes/ids", response_model=schemas.Page[int])
+async def get_liked_pin_ids(
+    user_id: int,
+    pin_ids: list[int] | None = Query(None, max_length=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    if pin_ids:
+        liked = set(
+            (await db.execute(
+                select(Like.pin_id).where(Like.user_id == user_id, Like.pin_id.in_(pin_ids))
+            )).scalars()
+        )
+        return {"items": [pin_id for pin_id in dict.fromkeys(pin_ids) if pin_id in liked]}
+
+    stmt = (
+        select(Like.pin_id, Like.created_at, Like.like_id)
+        .where(Like.user_id == user_id)
+        .order_by(Like.created_at.desc(), Like.like_id.desc())
+    )
+    if cursor:
+        stmt = stmt.where(
+            keyset_after((Like.created_at, Like.like_id), decode_cursor(cursor, datetime, int))
+        )
+
+    rows = (await db.execute(stmt.limit(limit + 1))).all()
+    page = paginate(rows, limit, lambda row: (row.created_at, row.like_id))
+    page["items"] = [row.pin_id for row in page["items"]]
+    return page
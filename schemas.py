@@ -1,5 +1,10 @@
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, Field, validator
+from typing import Generic, Literal, TypeVar
+from pydantic import BaseModel, EmailStr, Field, model_validator, validator
+
+import config
+
+T = TypeVar("T")
 
 # --- common ---
 class ErrorDetail(BaseModel):
@@ -10,6 +15,16 @@ class ErrorDetail(BaseModel):
 class ErrorResponse(BaseModel):
     detail: ErrorDetail
 
+# 커서 기반 페이지 응답
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+
+# 여러 id 일괄 조회 응답 (요청한 순서 유지, 없는 id는 missing)
+class Batch(BaseModel, Generic[T]):
+    items: list[T]
+    missing: list[int] = []
+
 
 # --- user ---
 # 회원가입 요청
@@ -63,6 +78,22 @@ class PinDelete(BaseModel):
     user_id: int
     
 
+# 핀 이미지 너비별 URL (리사이즈 전이면 원본 URL)
+def variant_urls(image: str | None, ready: str | None) -> dict[str, str]:
+    if not image:
+        return {}
+
+    ready_widths = set(ready.split(",")) if ready else set()
+    digest = image.rsplit("/", 1)[-1].split(".", 1)[0]
+    ext = "jpg" if config.IMAGE_VARIANT_FORMAT == "jpeg" else config.IMAGE_VARIANT_FORMAT
+
+    return {
+        str(width): (
+            f"/src/variants/{digest}_{width}.{ext}" if str(width) in ready_widths else image
+        )
+        for width in config.IMAGE_VARIANT_WIDTHS
+    }
+
 # Pin 조회 응답
 class PinResponse(BaseModel):
     pin_id: int
@@ -70,14 +101,44 @@ class PinResponse(BaseModel):
     title: str
     content: str 
     image: str | None = None
+    image_variants: dict[str, str] = {} # {"236": url, ...}
+    like_count: int = 0
+    comment_count: int = 0
     created_at: datetime
     updated_at: datetime
 
+    variant_widths: str | None = Field(default=None, exclude=True)
+
     model_config = {"from_attributes": True}
 
+    @model_validator(mode="after")
+    def _fill_image_variants(self):
+        self.image_variants = variant_urls(self.image, self.variant_widths)
+        return self
+
+# 핀 목록 응답 형태 (summary: 그리드 타일용, content/카운트/시각 제외)
+PinView = Literal["full", "summary"]
+
+# 핀 그리드용 요약 응답 (?view=summary)
+class PinSummary(BaseModel):
+    pin_id: int
+    user_id: int
+    title: str
+    image: str | None = None
+    image_variants: dict[str, str] = {}
+
 
 # --- like ---
 
+# 핀별 좋아요/댓글 수 (일괄 조회용)
+class PinCounts(BaseModel):
+    pin_id: int
+    like_count: int
+    comment_count: int
+
+    model_config = {"from_attributes": True}
+
+
 # 즐겨찾기 요청용 (요청 바디/내부 DTO)
 class LikeIn(BaseModel):
     user_id: int
@@ -92,6 +153,13 @@ class LikeOut(BaseModel):
     updated_at: datetime
 
 
+# 즐겨찾기 추가/취소 응답용 (PUT/DELETE, 여러 번 호출해도 같은 결과)
+class LikeState(BaseModel):
+    user_id: int
+    pin_id: int
+    liked: bool
+
+
 
 # --- comment ---
 
@@ -110,6 +178,9 @@ class CommentDelete(BaseModel):
     user_id: int
 
 
+# 댓글 정렬 (oldest: 오래된 순, newest: 최신순)
+CommentOrder = Literal["oldest", "newest"]
+
 # 댓글 불러오기
 class CommentResponse(BaseModel):
     comment_id: int
@@ -120,3 +191,20 @@ class CommentResponse(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+# --- job ---
+
+# 백그라운드 작업 상태 (queued: 대기/재시도 대기, running: 실행 중, done: 완료, failed: 재시도 초과)
+class JobResponse(BaseModel):
+    job_id: int
+    kind: str
+    status: Literal["queued", "running", "done", "failed"]
+    attempts: int
+    max_attempts: int
+    last_error: str | None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: datetime | None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,186 @@
+"""
+라우터 쿼리 실행 계획 점검
+
+임시 DB를 Alembic head까지 마이그레이션한 뒤 모든 API를 한 번씩 호출하고,
+실행된 SELECT/UPDATE/DELETE 쿼리마다 EXPLAIN QUERY PLAN을 확인해
+풀 테이블 스캔(또는 정렬용 임시 B-tree)을 사용하는 쿼리를 보고한다.
+
+    python -m scripts.check_query_plans
+
+풀 스캔이 하나라도 있으면 종료 코드 1
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import event
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# 이미지 업로드용 1x1 GIF
+_GIF = (
+    b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00"
+    b",\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+)
+
+
+def _migrate(url: str) -> None:
+    config = Config(str(BASE_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BASE_DIR / "migrations"))
+    config.set_main_option("sqlalchemy.url", url)
+    command.upgrade(config, "head")
+
+
+def _exercise(client) -> None:
+    """
+    모든 라우트를 한 번씩 호출
+    """
+    user = client.post(
+        "/api/users/signup",
+        json={"email": "plan@example.com", "username": "plan", "password": "plan"},
+    ).json()
+    user_id = user["user_id"]
+    client.post("/api/users/login", json={"email": "plan@example.com", "password": "plan"})
+
+    created = client.post(
+        "/api/pins/",
+        data={"user_id": user_id, "title": "plan", "content": "plan"},
+        files={"image": ("plan.gif", _GIF, "image/gif")},
+    )
+    pin_id = created.json()["pin_id"]
+
+    # 리사이즈 작업이 끝날 때까지 상태 조회 (작업 큐 쿼리도 점검)
+    job_url = f"/api/jobs/{created.headers['X-Job-Id']}"
+    for _ in range(100):
+        if client.get(job_url).json()["status"] in ("done", "failed"):
+            break
+        time.sleep(0.1)
+
+    first_page = client.get("/api/pins/", params={"limit": 1}).json()
+    client.get("/api/pins/", params={"limit": 1, "cursor": first_page["next_cursor"] or ""})
+    client.get("/api/pins/search", params={"search": "plan"})
+    client.get("/api/pins/feed")
+    client.get("/api/pins/", params={"view": "summary"})
+    client.get("/api/pins/search", params={"search": "plan", "recency": 1, "view": "summary"})
+    client.get("/api/pins/feed", params={"view": "summary"})
+    client.get("/api/pins/batch", params={"ids": [pin_id, pin_id + 1]})
+    client.get("/api/pins/counts", params={"ids": [pin_id, pin_id + 1]})
+    client.get("/api/users/batch", params={"ids": [user_id, user_id + 1]})
+    client.get(f"/api/pins/{pin_id}")
+    client.put(f"/api/pins/{pin_id}", data={"user_id": user_id, "title": "plan2"})
+    client.post(f"/api/pins/{pin_id}/likes", json={"user_id": user_id})
+    client.put(f"/api/pins/{pin_id}/likes", json={"user_id": user_id})
+
+    comment = client.post(
+        f"/api/pins/{pin_id}/comments", json={"user_id": user_id, "content": "plan"}
+    ).json()
+    client.post(f"/api/pins/{pin_id}/comments", json={"user_id": user_id, "content": "plan"})
+    for order in ("oldest", "newest"):
+        comments = client.get(f"/api/pins/{pin_id}/comments", params={"limit": 1, "order": order}).json()
+        client.get(
+            f"/api/pins/{pin_id}/comments",
+            params={"limit": 1, "order": order, "cursor": comments["next_cursor"] or ""},
+        )
+    client.head(f"/api/pins/{pin_id}/comments")
+    client.put(
+        f"/api/pins/comments/{comment['comment_id']}",
+        json={"user_id": user_id, "content": "plan2"},
+    )
+
+    client.get(f"/api/users/{user_id}")
+    client.get(f"/api/users/{user_id}/pins")
+    client.get(f"/api/users/{user_id}/pins", params={"view": "summary"})
+    liked = client.get(f"/api/users/{user_id}/likes", params={"limit": 1}).json()
+    client.get(f"/api/users/{user_id}/likes", params={"limit": 1, "cursor": liked["next_cursor"] or ""})
+    client.get(f"/api/users/{user_id}/likes/ids")
+    client.get(f"/api/users/{user_id}/likes/ids", params={"pin_ids": [pin_id, pin_id + 1]})
+    client.put(f"/api/users/{user_id}", json={"username": "plan2"})
+    client.request("DELETE", f"/api/pins/{pin_id}/likes", json={"user_id": user_id})
+
+    client.request(
+        "DELETE", f"/api/pins/comments/{comment['comment_id']}", json={"user_id": user_id}
+    )
+    client.request("DELETE", f"/api/pins/{pin_id}", json={"user_id": user_id})
+
+
+def _full_scans(statement: str, plan: list[str]) -> list[str]:
+    """
+    풀 스캔으로 판단되는 실행 계획 항목 반환
+    인덱스 순서 스캔(SCAN ... USING INDEX)은 LIMIT이 있을 때만 허용
+    """
+    limited = " LIMIT " in statement.upper()
+    # 전문 검색은 매칭된 행만 점수순으로 정렬하므로 임시 B-tree 허용
+    full_text = any("VIRTUAL TABLE" in detail for detail in plan)
+    bad = []
+    for detail in plan:
+        if detail.startswith("SCAN ") and "VIRTUAL TABLE" not in detail:
+            if " USING " not in detail or not limited:
+                bad.append(detail)
+        elif detail.startswith("USE TEMP B-TREE") and not full_text:
+            bad.append(detail)
+    return bad
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/plan.db"
+        # 앱/마이그레이션 모두 임시 DB 사용 (database import 전에 설정)
+        os.environ["DATABASE_URL"] = url
+        _migrate(url)
+
+        # 업로드 파일이 저장소 src/ 에 남지 않도록 임시 폴더에서 실행
+        os.chdir(tmp)
+        os.makedirs("src", exist_ok=True)
+
+        import database
+
+        statements: dict[str, tuple] = {}
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            # 피드 스냅샷 전체 재계산처럼 의도된 전체 스캔은 제외
+            if context.execution_options.get("full_scan"):
+                return
+            verb = statement.lstrip().split(None, 1)[0].upper()
+            if verb in ("SELECT", "UPDATE", "DELETE") and not executemany:
+                statements.setdefault(statement, parameters)
+
+        for app_engine in {database.async_engine, database.read_async_engine}:
+            event.listen(app_engine.sync_engine, "before_cursor_execute", _capture)
+
+        from fastapi.testclient import TestClient
+        import main as app_main
+
+        with TestClient(app_main.app) as client:
+            _exercise(client)
+
+        failures = 0
+        with database.engine.connect() as conn:
+            for statement, parameters in statements.items():
+                rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+                plan = [row[-1] for row in rows]
+                bad = _full_scans(statement, plan)
+                if bad:
+                    failures += 1
+                    print("FULL SCAN:", " ".join(statement.split()))
+                    for detail in bad:
+                        print("    ", detail)
+
+        async def _dispose():
+            await database.async_engine.dispose()
+            await database.read_async_engine.dispose()
+
+        asyncio.run(_dispose())
+        database.engine.dispose()
+        os.chdir(BASE_DIR)
+
+    print(f"{len(statements)} queries checked, {failures} with full table scans")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+"""
+참조되지 않는 이미지 정리
+
+핀 삭제 / 이미지 교체로 더 이상 쓰이지 않는 src/ 파일을 지운다.
+
+    python -m scripts.gc_images [--dry-run] [--grace-seconds 3600]
+"""
+import argparse
+
+from database import SessionLocal
+from services import images
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Remove unreferenced pin images")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 출력")
+    parser.add_argument("--grace-seconds", type=int, default=images.GC_GRACE_SECONDS)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        result = images.collect_garbage(db, args.grace_seconds, args.dry_run)
+
+    for url in result.blobs + result.orphans:
+        print(("would remove " if args.dry_run else "removed ") + url)
+    print(f"{len(result.blobs)} unreferenced images, {len(result.orphans)} orphan files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+핀 검색 인덱스(FTS5) 재생성
+
+기존 핀 데이터로 pins_fts 를 처음부터 다시 만든다.
+
+    python -m scripts.rebuild_search_index
+"""
+from database import SessionLocal
+from services import search
+
+
+def main() -> None:
+    with SessionLocal() as db:
+        count = search.rebuild(db)
+        db.commit()
+
+    print(f"indexed {count} pins")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+핀 좋아요/댓글 수 재계산
+
+pins.like_count, pins.comment_count 를 likes, comments 테이블 기준으로 맞춘다.
+(마이그레이션 이전 데이터, 직접 수정한 데이터 등으로 어긋난 경우)
+
+    python -m scripts.reconcile_counters [--dry-run]
+"""
+import argparse
+
+from database import SessionLocal
+from services import counters
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recompute pin like/comment counters")
+    parser.add_argument("--dry-run", action="store_true", help="수정하지 않고 대상만 출력")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        pin_ids = counters.reconcile(db, args.dry_run)
+
+    for pin_id in pin_ids:
+        print(("would fix " if args.dry_run else "fixed ") + f"pin {pin_id}")
+    print(f"{len(pin_ids)} pins with stale counters")
+
+
+if __name__ == "__main__":
+    main()
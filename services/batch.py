@@ -0,0 +1,24 @@
+from typing import Any, Callable, Iterable, Sequence
+
+from fastapi import Query
+
+# 일괄 조회 최대 id 수 (SQLite 변수 개수 제한보다 충분히 작게)
+MAX_BATCH_SIZE = 100
+
+
+def batch_ids(ids: list[int] = Query(..., min_length=1, max_length=MAX_BATCH_SIZE)) -> list[int]:
+    """
+    ?ids=1&ids=2 형태의 id 목록 (중복 제거, 순서 유지)
+    """
+    return list(dict.fromkeys(ids))
+
+
+def ordered(ids: Sequence[int], rows: Iterable[Any], key: Callable[[Any], int]) -> dict:
+    """
+    IN 조회 결과를 요청한 id 순서로 정렬하고 없는 id 표시
+    """
+    found = {key(row): row for row in rows}
+    return {
+        "items": [found[i] for i in ids if i in found],
+        "missing": [i for i in ids if i not in found],
+    }
@@ -0,0 +1,206 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import config
+import database
+from api.models import CacheInvalidation
+
+# 현재 요청에서 이미 sync() 했는지 (요청마다 한 번만 확인)
+_synced: ContextVar[bool] = ContextVar("read_cache_synced", default=False)
+
+
+def invalidate_statement(scope: str):
+    """
+    scope의 seq를 전체 최대값 + 1 로 올리는 upsert
+    (동기 세션을 쓰는 관리 스크립트도 같은 문장으로 무효화 기록)
+    """
+    next_seq = select(func.coalesce(func.max(CacheInvalidation.seq), 0) + 1).scalar_subquery()
+    stmt = sqlite_insert(CacheInvalidation).values(scope=scope, seq=next_seq)
+    return stmt.on_conflict_do_update(
+        index_elements=[CacheInvalidation.scope], set_={"seq": stmt.excluded.seq}
+    )
+
+
+@dataclass
+class _Entry:
+    value: Any
+    scopes: frozenset[str]
+    expires_at: float
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0 # 크기 초과 / TTL 만료로 제거
+    invalidations: int = 0 # 쓰기로 무효화되어 제거
+
+
+class ReadCache:
+    """
+    조회 결과 LRU + TTL 캐시 (워커 프로세스별)
+
+    - 쓰기 경로는 bump()로 영향받는 scope를 cache_invalidations 테이블에 기록 (같은 트랜잭션)
+    - 요청의 첫 get() 에서 sync()로 PRAGMA data_version을 확인하고 (스레드에서 실행, 요청당 한 번),
+      바뀌었을 때만 seq가 증가한 scope를 읽어 해당 항목을 무효화
+    → 여러 uvicorn 워커가 같은 DB 파일을 써도 다른 워커의 쓰기가 반영됨
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._by_scope: dict[str, set[str]] = {}
+        self._epoch = 0 # 무효화가 일어날 때마다 증가
+
+        self._watch: sqlite3.Connection | None = None
+        self._watch_lock = threading.Lock()
+        self._data_version: int | None = None
+        self._seen_seq = 0
+
+    @property
+    def enabled(self) -> bool:
+        # data_version 확인이 SQLite 파일 전용이라 메모리 DB / 다른 DB에서는 사용하지 않음
+        url = database.engine.url
+        return (
+            self.max_entries > 0
+            and url.get_backend_name() == "sqlite"
+            and url.database not in (None, "", ":memory:")
+            and url.query.get("mode") != "memory"
+        )
+
+    # --- 다른 커넥션/워커의 쓰기 반영 ---
+    def _connection(self) -> sqlite3.Connection:
+        if self._watch is None:
+            self._watch = sqlite3.connect(
+                database.engine.url.database, check_same_thread=False, isolation_level=None
+            )
+            self._data_version = self._watch.execute("PRAGMA data_version").fetchone()[0]
+            row = self._watch.execute("SELECT MAX(seq) FROM cache_invalidations").fetchone()
+            self._seen_seq = row[0] or 0
+        return self._watch
+
+    def _poll(self, seen_seq: int) -> list[tuple[str, int]]:
+        """
+        data_version이 바뀌었으면 seen_seq 이후 기록된 무효화 scope 반환 (작업 스레드에서 실행)
+        """
+        with self._watch_lock:
+            conn = self._connection()
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if version == self._data_version:
+                return []
+            self._data_version = version
+
+            return conn.execute(
+                "SELECT scope, seq FROM cache_invalidations WHERE seq > ?", (seen_seq,)
+            ).fetchall()
+
+    async def sync(self) -> None:
+        """
+        다른 커넥션/워커가 기록한 무효화 반영 (요청마다 한 번, 이벤트 루프를 막지 않도록 스레드에서 확인)
+        """
+        if _synced.get():
+            return
+        _synced.set(True)
+
+        rows = await asyncio.to_thread(self._poll, self._seen_seq)
+        for scope, seq in rows:
+            self._seen_seq = max(self._seen_seq, seq)
+            self._drop_scope(scope)
+
+    # --- 조회 ---
+    async def get(self, key: str) -> Any | None:
+        if not self.enabled:
+            return None
+
+        await self.sync()
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if entry.expires_at < time.monotonic():
+            self._remove(key)
+            self.stats.evictions += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def token(self) -> int:
+        """
+        DB 조회 전에 받아 두고 set()에 넘김
+        조회 도중 무효화가 있었으면 set()이 저장하지 않음 (오래된 값 캐시 방지)
+        """
+        return self._epoch
+
+    def set(self, key: str, value: Any, scopes: set[str] | frozenset[str], token: int) -> None:
+        if not self.enabled:
+            return
+
+        # 조회 도중 다른 워커의 무효화는 다음 요청의 sync()가 이 항목을 지움
+        if token != self._epoch:
+            return
+
+        self._remove(key)
+        self._entries[key] = _Entry(value, frozenset(scopes), time.monotonic() + self.ttl)
+        for scope in scopes:
+            self._by_scope.setdefault(scope, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    # --- 쓰기 경로 ---
+    async def bump(self, db: AsyncSession, *scopes: str) -> None:
+        """
+        쓰기 트랜잭션 안에서 호출 → 커밋되면 모든 워커의 해당 scope 캐시가 무효화
+        """
+        for scope in scopes:
+            await db.execute(invalidate_statement(scope))
+            # 현재 워커는 바로 무효화 (커밋 전 다시 채워진 값은 sync()가 다시 무효화)
+            self._drop_scope(scope)
+
+    # --- 내부 ---
+    def _drop_scope(self, scope: str) -> None:
+        self._epoch += 1
+        for key in self._by_scope.pop(scope, ()):
+            if key in self._entries:
+                self._remove(key)
+                self.stats.invalidations += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for scope in entry.scopes:
+            keys = self._by_scope.get(scope)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_scope[scope]
+
+    def snapshot(self) -> dict:
+        return {
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "evictions": self.stats.evictions,
+            "invalidations": self.stats.invalidations,
+            "size": len(self._entries),
+        }
+
+
+read_cache = ReadCache(config.READ_CACHE_ENTRIES, config.READ_CACHE_TTL)
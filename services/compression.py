@@ -0,0 +1,101 @@
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+
+import config
+
+# brotli가 없으면 gzip만 사용
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 압축할 응답 (스트리밍 / 이미지 등은 그대로 전달)
+COMPRESSIBLE_TYPES = ("application/json",)
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """
+    Accept-Encoding 에서 q=0 이 아닌 인코딩 목록
+    """
+    accepted = set()
+    for part in header.lower().split(","):
+        name, _, params = part.partition(";")
+        q = params.strip().removeprefix("q=")
+        try:
+            if params and float(q) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(name.strip())
+    return accepted
+
+
+def _choose(header: str) -> str | None:
+    accepted = _accepted_encodings(header)
+    if brotli is not None and ("br" in accepted or "*" in accepted):
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=config.BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=config.GZIP_LEVEL)
+
+
+class CompressionMiddleware:
+    """
+    JSON 응답을 Accept-Encoding 에 따라 brotli / gzip 으로 압축
+    - COMPRESS_MIN_BYTES 보다 작은 응답, 이미 인코딩된 응답(미리 압축된 이미지 등),
+      여러 조각으로 나눠 보내는 스트리밍 응답은 그대로 전달
+    """
+
+    def __init__(self, app, minimum_size: int = config.COMPRESS_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = _choose(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+
+        async def send_compressed(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if "content-encoding" in headers or not content_type.startswith(COMPRESSIBLE_TYPES):
+                    # 압축 대상이 아니면 바로 전송 (SSE 등 스트리밍 응답이 지연되지 않도록)
+                    await send(message)
+                    return
+                # 본문 크기를 알 때까지 헤더 전송 보류
+                start = message
+                return
+            if start is None:
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            headers.add_vary_header("Accept-Encoding")
+            if not message.get("more_body", False) and len(body) >= self.minimum_size:
+                body = _compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                message = {**message, "body": body}
+
+            await send(start)
+            start = None
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
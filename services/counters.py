@@ -0,0 +1,91 @@
+from sqlalchemy import func, literal, or_, select, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+
+from api.models import Comment, Like, Pin
+from services.cache import invalidate_statement
+
+
+async def adjust(db: AsyncSession, pin_id: int, likes: int = 0, comments: int = 0) -> None:
+    """
+    좋아요/댓글 수 증감 (likes, comments 변경과 같은 트랜잭션)
+    카운터 변경은 핀 수정이 아니므로 updated_at(피드 정렬 기준)은 그대로 둠
+    """
+    await db.execute(
+        update(Pin)
+        .where(Pin.pin_id == pin_id)
+        .values(
+            like_count=Pin.like_count + likes,
+            comment_count=Pin.comment_count + comments,
+            updated_at=Pin.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _actual_counts():
+    """
+    likes, comments 를 한 번의 GROUP BY로 집계한 핀별 실제 값 (좋아요/댓글 없는 핀은 0)
+    """
+    events = union_all(
+        select(Like.pin_id, literal(1).label("likes"), literal(0).label("comments")),
+        select(Comment.pin_id, literal(0).label("likes"), literal(1).label("comments")),
+    ).subquery()
+    grouped = (
+        select(
+            events.c.pin_id,
+            func.sum(events.c.likes).label("likes"),
+            func.sum(events.c.comments).label("comments"),
+        )
+        .group_by(events.c.pin_id)
+        .subquery()
+    )
+    pin = aliased(Pin)
+    return (
+        select(
+            pin.pin_id,
+            func.coalesce(grouped.c.likes, 0).label("likes"),
+            func.coalesce(grouped.c.comments, 0).label("comments"),
+        )
+        .outerjoin(grouped, grouped.c.pin_id == pin.pin_id)
+        .subquery()
+    )
+
+
+def reconcile(db: Session, dry_run: bool = False, invalidate: bool = True) -> list[int]:
+    """
+    like_count / comment_count 를 likes, comments 기준으로 다시 계산 (관리 스크립트용, 동기 세션)
+    값이 달랐던 핀 id 목록 반환
+    invalidate=False 는 실행 중인 서버가 없는 DB(벤치마크 시드 등)에서 캐시 무효화 기록 생략
+    """
+    actual = _actual_counts()
+    mismatched = or_(
+        Pin.like_count != actual.c.likes,
+        Pin.comment_count != actual.c.comments,
+    )
+
+    if dry_run:
+        return list(
+            db.execute(
+                select(Pin.pin_id).join(actual, actual.c.pin_id == Pin.pin_id).where(mismatched)
+            ).scalars()
+        )
+
+    fixed = list(
+        db.execute(
+            update(Pin)
+            .where(Pin.pin_id == actual.c.pin_id, mismatched)
+            .values(
+                like_count=actual.c.likes,
+                comment_count=actual.c.comments,
+                updated_at=Pin.updated_at,
+            )
+            .returning(Pin.pin_id)
+            .execution_options(synchronize_session=False)
+        ).scalars()
+    )
+    # 캐시된 핀 응답 무효화
+    for pin_id in fixed if invalidate else ():
+        db.execute(invalidate_statement(f"pin:{pin_id}"))
+    db.commit()
+    return fixed
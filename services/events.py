@@ -0,0 +1,194 @@
+import asyncio
+import itertools
+import os
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+import config
+from services.serialization import dumps
+
+
+@dataclass(eq=False)
+class _Channel:
+    """
+    핀 하나의 구독자 큐 + 최근 이벤트 (Last-Event-ID 재연결 시 다시 보냄)
+    complete_after 이후 seq 의 이벤트는 모두 recent 에 남아 있음
+    """
+    recent: deque
+    complete_after: int
+    subscribers: set = field(default_factory=set)
+    idle_since: float | None = None # 마지막 구독자가 나간 시각 (구독 중이면 None)
+
+
+class EventHub:
+    """
+    핀별 실시간 이벤트(댓글/좋아요) 발행 / 구독 (워커 프로세스별 메모리)
+
+    - 이벤트는 발행 시 한 번만 SSE 프레임으로 인코딩해 모든 구독자가 공유
+    - 구독자 큐가 가득 차면(느린 클라이언트) 연결을 끊고, 클라이언트가
+      Last-Event-ID 로 재연결하면 핀별 최근 이벤트 버퍼에서 이어서 보냄
+    - 버퍼에서 이미 밀려난 이벤트부터 이어받아야 하면 reset 이벤트 → 클라이언트가 댓글 목록을 다시 조회
+    - 버퍼는 구독자가 있는 핀(또는 재연결 대기 중인 grace 초 동안)에만 유지, 그 외 핀의 이벤트는 버림
+    - 이벤트 id 는 "<프로세스 id>-<seq>" 라서 재시작/다른 워커의 id 도 reset 으로 처리
+    """
+
+    def __init__(self, queue_size: int, buffer_size: int, max_channels: int, heartbeat: float, grace: float):
+        self.queue_size = queue_size
+        self.buffer_size = buffer_size
+        self.max_channels = max_channels
+        self.heartbeat = heartbeat
+        self.grace = grace
+        self._boot = os.urandom(4).hex()
+        self._seq = itertools.count(1)
+        self._last = 0
+        self._channels: OrderedDict[int, _Channel] = OrderedDict()
+        self._swept_at = time.monotonic()
+        self._closed = False
+        self.dropped = 0 # 느려서 끊은 구독자 수
+
+    def _channel(self, pin_id: int) -> _Channel:
+        channel = self._channels.get(pin_id)
+        if channel is None:
+            channel = _Channel(deque(maxlen=self.buffer_size), complete_after=self._last)
+            self._channels[pin_id] = channel
+            self._evict()
+        self._channels.move_to_end(pin_id)
+        return channel
+
+    def _expired(self, channel: _Channel, now: float) -> bool:
+        return not channel.subscribers and (channel.idle_since is None or now - channel.idle_since >= self.grace)
+
+    def _evict(self) -> None:
+        # 구독자가 없는 오래된 핀부터 버퍼 정리
+        for pin_id in list(self._channels):
+            if len(self._channels) <= self.max_channels:
+                break
+            if not self._channels[pin_id].subscribers:
+                del self._channels[pin_id]
+
+    def _sweep(self) -> None:
+        """
+        재연결 대기 시간이 지난 구독자 없는 핀의 버퍼 정리 (grace 초에 한 번)
+        """
+        now = time.monotonic()
+        if now - self._swept_at < self.grace:
+            return
+        self._swept_at = now
+        for pin_id, channel in list(self._channels.items()):
+            if self._expired(channel, now):
+                del self._channels[pin_id]
+
+    def _end(self, queue: asyncio.Queue) -> None:
+        """
+        구독 종료 (대기 중인 이벤트를 버리고 스트림 끝 표시)
+        """
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def publish(self, pin_id: int, event: str, data: Any) -> None:
+        """
+        이벤트 발행 (커밋 후 호출)
+        """
+        seq = self._last = next(self._seq)
+        self._sweep()
+        channel = self._channels.get(pin_id)
+        if channel is None or self._expired(channel, time.monotonic()):
+            # 구독자가 없으면 버퍼에 남기지 않음 (나중에 구독하면 이 seq 이전 id 는 reset)
+            self._channels.pop(pin_id, None)
+            return
+
+        frame = f"id: {self._boot}-{seq}\nevent: {event}\ndata: ".encode() + dumps(data) + b"\n\n"
+        if len(channel.recent) == self.buffer_size:
+            channel.complete_after = channel.recent[0][0]
+        channel.recent.append((seq, frame))
+
+        for queue in list(channel.subscribers):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._leave(channel, queue)
+                self._end(queue)
+                self.dropped += 1
+
+    def _leave(self, channel: _Channel, queue: asyncio.Queue) -> None:
+        channel.subscribers.discard(queue)
+        if not channel.subscribers and channel.idle_since is None:
+            channel.idle_since = time.monotonic()
+
+    def _subscribe(self, pin_id: int, last_event_id: str | None) -> tuple[asyncio.Queue, list[bytes]]:
+        """
+        구독 등록 + 먼저 보낼 프레임 (재연결 시 놓친 이벤트 또는 reset)
+        """
+        self._sweep()
+        channel = self._channel(pin_id)
+        head = [f"retry: {config.EVENTS_RETRY_MS}\n\n".encode()]
+
+        if last_event_id:
+            boot, _, seq = last_event_id.partition("-")
+            last = int(seq) if boot == self._boot and seq.isdigit() else -1
+            if last < channel.complete_after:
+                head.append(f"id: {self._boot}-{self._last}\nevent: reset\ndata: {{}}\n\n".encode())
+            else:
+                head += [frame for event_seq, frame in channel.recent if event_seq > last]
+        else:
+            # 이벤트가 오기 전에 끊겨도 이어받을 수 있도록 현재 위치를 id 로 알려 줌
+            head.append(f"id: {self._boot}-{self._last}\n\n".encode())
+
+        queue = asyncio.Queue(self.queue_size)
+        if self._closed:
+            self._end(queue)
+        else:
+            channel.subscribers.add(queue)
+            channel.idle_since = None
+        return queue, head
+
+    async def stream(self, pin_id: int, last_event_id: str | None = None) -> AsyncIterator[bytes]:
+        """
+        SSE 응답 본문 (이벤트가 없으면 heartbeat 주석으로 연결 유지)
+        """
+        queue, head = self._subscribe(pin_id, last_event_id)
+        try:
+            for frame in head:
+                yield frame
+            while True:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), self.heartbeat)
+                except asyncio.TimeoutError:
+                    yield b": ping\n\n"
+                    continue
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            channel = self._channels.get(pin_id)
+            if channel is not None:
+                self._leave(channel, queue)
+
+    def snapshot(self) -> dict:
+        return {
+            "channels": len(self._channels),
+            "subscribers": sum(len(channel.subscribers) for channel in self._channels.values()),
+            "dropped": self.dropped,
+        }
+
+    def close(self) -> None:
+        """
+        서버 종료 시 열린 스트림을 모두 끝냄 (종료가 연결 때문에 지연되지 않도록)
+        """
+        self._closed = True
+        for channel in self._channels.values():
+            for queue in channel.subscribers:
+                self._end(queue)
+            channel.subscribers.clear()
+
+
+hub = EventHub(
+    config.EVENTS_QUEUE_SIZE,
+    config.EVENTS_BUFFER_SIZE,
+    config.EVENTS_MAX_PINS,
+    config.EVENTS_HEARTBEAT_SECONDS,
+    config.EVENTS_GRACE_SECONDS,
+)
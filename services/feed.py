@@ -0,0 +1,159 @@
+import asyncio
+import bisect
+import calendar
+import logging
+import math
+import time
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import config
+import database
+from api.models import CacheInvalidation, Pin
+
+logger = logging.getLogger(__name__)
+
+# 재계산 시 한 번에 조회할 핀 수 (SQLite 변수 개수 제한)
+_CHUNK = 500
+
+
+def hot_score(created_at: datetime, like_count: int, comment_count: int) -> float:
+    """
+    log10(반응 수) + 작성 시각 / 감쇠 주기
+    - 반응이 10배 많으면 FEED_DECAY_HOURS 만큼 먼저 쓴 핀과 같은 점수
+    - 점수가 시간에 따라 변하지 않아 바뀐 핀만 다시 계산하면 순위가 유지됨
+      (오래된 핀은 새 핀보다 상대적으로 내려감 → 최근성 감쇠)
+    수정(updated_at)은 점수에 영향 없음
+    """
+    engagement = like_count + config.FEED_COMMENT_WEIGHT * comment_count
+    created = calendar.timegm(created_at.timetuple())
+    return math.log10(max(engagement, 1)) + created / (config.FEED_DECAY_HOURS * 3600)
+
+
+class FeedSnapshot:
+    """
+    홈 피드 순위 스냅샷 (워커 프로세스별 메모리)
+
+    - _entries: (-score, -pin_id) 오름차순 배열 → 점수 높은 순, 같은 점수는 최신 핀 먼저
+    - 페이지 조회는 커서 위치를 bisect로 찾아 잘라냄 (O(log n + 페이지 크기))
+    - 갱신은 cache_invalidations 에서 seq가 증가한 pin:* scope의 핀만 다시 계산
+      (생성/좋아요/댓글/수정/삭제 모두 해당 핀 scope를 올림)
+    - 오래 쓰면 생길 수 있는 누락에 대비해 FEED_FULL_REFRESH_SECONDS 마다 전체 재계산
+    """
+
+    def __init__(self, refresh_seconds: float, full_refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.full_refresh_seconds = full_refresh_seconds
+        self._entries: list[tuple[float, int]] = []
+        self._scores: dict[int, float] = {}
+        self._seen_seq = 0
+        self._refreshed_at = 0.0
+        self._full_at = 0.0
+        self._lock: asyncio.Lock | None = None
+        self._task: asyncio.Task | None = None
+
+    # --- 조회 ---
+    async def page(self, after: tuple[float, int] | None, limit: int) -> tuple[list[tuple[float, int]], bool]:
+        """
+        after(점수, pin_id) 다음부터 limit개의 (점수, pin_id) 와 다음 페이지 여부
+        """
+        await self._ensure_fresh()
+
+        start = 0
+        if after is not None:
+            score, pin_id = after
+            start = bisect.bisect_right(self._entries, (-score, -pin_id))
+        chunk = self._entries[start:start + limit + 1]
+        return [(-neg_score, -neg_id) for neg_score, neg_id in chunk[:limit]], len(chunk) > limit
+
+    async def _ensure_fresh(self) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # 첫 조회는 스냅샷이 만들어질 때까지 대기, 이후에는 백그라운드에서 갱신
+        if not self._refreshed_at:
+            async with self._lock:
+                if not self._refreshed_at:
+                    await self.refresh()
+            return
+
+        stale = time.monotonic() - self._refreshed_at >= self.refresh_seconds
+        if stale and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._refresh_in_background())
+
+    async def _refresh_in_background(self) -> None:
+        async with self._lock:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Failed to refresh feed snapshot")
+
+    # --- 갱신 ---
+    async def refresh(self) -> None:
+        now = time.monotonic()
+        async with database.ReadSessionLocal() as db:
+            if not self._full_at or now - self._full_at >= self.full_refresh_seconds:
+                await self._rebuild(db)
+                self._full_at = now
+            else:
+                await self._update(db)
+        self._refreshed_at = now
+
+    async def _rebuild(self, db: AsyncSession) -> None:
+        # 변경 기록 위치를 먼저 읽어 두고 핀을 읽음 (그 사이 변경은 다음 갱신에서 반영)
+        seen_seq = (await db.execute(select(func.max(CacheInvalidation.seq)))).scalar() or 0
+
+        rows = (
+            await db.execute(
+                select(Pin.pin_id, Pin.created_at, Pin.like_count, Pin.comment_count)
+                .execution_options(full_scan=True) # 의도된 전체 스캔 (쿼리 계획 점검 제외)
+            )
+        ).all()
+
+        scores = {row.pin_id: hot_score(row.created_at, row.like_count, row.comment_count) for row in rows}
+        self._entries = sorted((-score, -pin_id) for pin_id, score in scores.items())
+        self._scores = scores
+        self._seen_seq = seen_seq
+
+    async def _update(self, db: AsyncSession) -> None:
+        changes = (
+            await db.execute(
+                select(CacheInvalidation.scope, CacheInvalidation.seq)
+                .where(CacheInvalidation.seq > self._seen_seq)
+            )
+        ).all()
+
+        changed: set[int] = set()
+        for scope, seq in changes:
+            self._seen_seq = max(self._seen_seq, seq)
+            if scope.startswith("pin:"):
+                changed.add(int(scope.removeprefix("pin:")))
+
+        columns = (Pin.pin_id, Pin.created_at, Pin.like_count, Pin.comment_count)
+        rows = []
+        ids = sorted(changed)
+        for i in range(0, len(ids), _CHUNK):
+            rows.extend((await db.execute(select(*columns).where(Pin.pin_id.in_(ids[i:i + _CHUNK])))).all())
+
+        fresh = {row.pin_id: hot_score(row.created_at, row.like_count, row.comment_count) for row in rows}
+        # 다시 계산했는데 없는 핀은 삭제된 핀
+        removed = changed - fresh.keys()
+
+        for pin_id in removed | fresh.keys():
+            old = self._scores.pop(pin_id, None)
+            if old is not None:
+                index = bisect.bisect_left(self._entries, (-old, -pin_id))
+                del self._entries[index]
+        for pin_id, score in fresh.items():
+            bisect.insort(self._entries, (-score, -pin_id))
+            self._scores[pin_id] = score
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+snapshot = FeedSnapshot(config.FEED_REFRESH_SECONDS, config.FEED_FULL_REFRESH_SECONDS)
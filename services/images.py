@@ -0,0 +1,117 @@
+import os
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from api.models import Image, Pin
+from services.thumbnails import VARIANT_DIR
+from services.uploads import UPLOAD_DIR, StoredImage
+
+# 업로드 직후 파일이 GC되지 않도록 하는 유예 기간 (초)
+GC_GRACE_SECONDS = 60 * 60
+
+
+async def acquire(db: AsyncSession, stored: StoredImage) -> None:
+    """
+    핀이 이미지를 참조하기 시작할 때 호출 (핀 변경과 같은 트랜잭션)
+    """
+    stmt = (
+        sqlite_insert(Image)
+        .values(digest=stored.digest, path=stored.url, size=stored.size, ref_count=1)
+        .on_conflict_do_update(
+            index_elements=[Image.digest],
+            set_={"ref_count": Image.ref_count + 1, "updated_at": func.now()},
+        )
+    )
+    await db.execute(stmt)
+
+
+async def release(db: AsyncSession, url: str | None) -> None:
+    """
+    핀이 이미지 참조를 그만둘 때 호출 (핀 변경과 같은 트랜잭션)
+    파일 삭제는 GC가 담당
+    """
+    if not url:
+        return
+    await db.execute(
+        update(Image).where(Image.path == url).values(ref_count=Image.ref_count - 1)
+    )
+
+
+@dataclass
+class GcResult:
+    blobs: list[str] = field(default_factory=list) # 참조 없는 이미지
+    orphans: list[str] = field(default_factory=list) # DB에 없는 파일 (예전 uuid 파일, 실패한 업로드 등)
+
+
+def _expired(path: str, cutoff: float) -> bool:
+    try:
+        return os.stat(path).st_mtime < cutoff
+    except FileNotFoundError:
+        return False
+
+
+def collect_garbage(db: Session, grace_seconds: int = GC_GRACE_SECONDS, dry_run: bool = False) -> GcResult:
+    """
+    참조되지 않는 이미지 파일 정리 (관리 스크립트용, 동기 세션)
+    1. ref_count를 pins 기준으로 다시 계산
+    2. ref_count = 0 인 이미지 행/파일 삭제
+    3. images, pins 어디에도 없는 src/ 파일 삭제
+    4. 원본이 없는 리사이즈 이미지(src/variants) 삭제
+    유예 기간 안에 만들어졌거나 재사용된 파일은 건드리지 않음
+    """
+    cutoff = time.time() - grace_seconds
+    result = GcResult()
+
+    refs = (
+        select(func.count())
+        .select_from(Pin)
+        .where(Pin.image == Image.path)
+        .correlate(Image)
+        .scalar_subquery()
+    )
+    db.execute(update(Image).values(ref_count=refs).execution_options(synchronize_session=False))
+
+    unreferenced = db.execute(select(Image.digest, Image.path).where(Image.ref_count <= 0)).all()
+    for digest, path in unreferenced:
+        file_path = os.path.join(UPLOAD_DIR, os.path.basename(path))
+        if not _expired(file_path, cutoff) and os.path.exists(file_path):
+            continue
+        result.blobs.append(path)
+        if not dry_run:
+            db.execute(delete(Image).where(Image.digest == digest, Image.ref_count <= 0))
+
+    known = set(db.execute(select(Image.path)).scalars())
+    known.update(db.execute(select(Pin.image).distinct()).scalars())
+    known.update(result.blobs)
+
+    for name in os.listdir(UPLOAD_DIR):
+        file_path = os.path.join(UPLOAD_DIR, name)
+        url = f"/src/{name}"
+        if url in known or not os.path.isfile(file_path) or not _expired(file_path, cutoff):
+            continue
+        result.orphans.append(url)
+
+    if os.path.isdir(VARIANT_DIR):
+        live = {os.path.basename(path).split(".", 1)[0] for path in known - set(result.blobs)}
+        for name in os.listdir(VARIANT_DIR):
+            if name.split("_", 1)[0] in live or not _expired(os.path.join(VARIANT_DIR, name), cutoff):
+                continue
+            result.orphans.append(f"/src/variants/{name}")
+
+    if dry_run:
+        db.rollback()
+        return result
+
+    db.commit()
+    for url in result.blobs + result.orphans:
+        file_path = os.path.join(UPLOAD_DIR, url.removeprefix("/src/"))
+        # 삭제 직전에 다시 확인 (그 사이 재사용된 파일 보호)
+        if _expired(file_path, cutoff):
+            os.remove(file_path)
+
+    return result
@@ -0,0 +1,267 @@
+import asyncio
+import json
+import logging
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# DB 관련 모듈은 함수 안에서 import
+# (핸들러를 등록하는 services.thumbnails 는 리사이즈 프로세스에서도 import 되므로 가볍게 유지)
+
+# 작업 종류 → 핸들러 (payload 를 키워드 인자로 받는 async 함수)
+_HANDLERS: dict[str, Callable[..., Awaitable[None]]] = {}
+
+
+def handler(kind: str):
+    """
+    작업 핸들러 등록
+    같은 작업이 두 번 실행될 수 있으므로(재시도, 프로세스 종료 후 재실행) 핸들러는 멱등이어야 함
+    """
+    def register(fn):
+        _HANDLERS[kind] = fn
+        return fn
+    return register
+
+
+def _now() -> datetime:
+    # run_after / finished_at 은 비교용이라 UTC naive 로 저장
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def backoff(attempts: int) -> float:
+    """
+    재시도 대기 시간 (시도마다 2배, 여러 작업이 같은 시각에 몰리지 않도록 절반은 무작위)
+    """
+    delay = min(config.JOBS_BACKOFF_SECONDS * 2 ** (attempts - 1), config.JOBS_BACKOFF_MAX_SECONDS)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+async def enqueue(
+    db,
+    kind: str,
+    payload: dict[str, Any],
+    key: str | None = None,
+    max_attempts: int = config.JOBS_MAX_ATTEMPTS,
+    requeue: bool = False,
+) -> int:
+    """
+    작업 등록 (호출한 쓰기 트랜잭션과 함께 커밋되고, 롤백되면 작업도 없어짐)
+    key 가 같은 작업이 이미 있으면 새로 만들지 않고 기존 job_id 반환
+    requeue=True 면 끝난(done/failed) 기존 작업을 대기 상태로 되돌려 다시 실행 (대기/실행 중이면 그대로)
+    커밋 후 pool.wake() 를 호출하면 바로 실행
+    """
+    from sqlalchemy import select
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+    from api.models import Job
+
+    stmt = sqlite_insert(Job).values(
+        kind=kind,
+        payload=json.dumps(payload),
+        idempotency_key=key,
+        max_attempts=max_attempts,
+        run_after=_now(),
+    )
+    if key is not None and requeue:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Job.idempotency_key],
+            set_={
+                "payload": stmt.excluded.payload,
+                "status": "queued",
+                "attempts": 0,
+                "max_attempts": stmt.excluded.max_attempts,
+                "run_after": stmt.excluded.run_after,
+                "last_error": None,
+                "finished_at": None,
+            },
+            where=Job.status.in_(("done", "failed")),
+        )
+    elif key is not None:
+        stmt = stmt.on_conflict_do_nothing(index_elements=[Job.idempotency_key])
+    job_id = (await db.execute(stmt.returning(Job.job_id))).scalar_one_or_none()
+    if job_id is None:
+        job_id = (await db.execute(select(Job.job_id).where(Job.idempotency_key == key))).scalar_one()
+    return job_id
+
+
+class JobPool:
+    """
+    jobs 테이블의 작업을 실행하는 asyncio 워커 풀 (워커 프로세스마다 하나)
+
+    - 작업은 BEGIN IMMEDIATE 트랜잭션에서 UPDATE ... RETURNING 으로 하나씩 가져오므로
+      여러 워커 프로세스가 같은 작업을 동시에 실행하지 않음
+    - 실행 중인 작업의 run_after 는 임대 만료 시각 → 프로세스가 죽으면 만료 후 다른 워커가 다시 실행
+    - 실패하면 backoff() 만큼 뒤로 미뤄 재시도, max_attempts 를 넘으면 failed
+    - CPU 작업은 핸들러가 프로세스 풀 등으로 넘겨야 함 (이벤트 루프에서 실행됨)
+    """
+
+    def __init__(self, workers: int, poll_interval: float):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup: asyncio.Event | None = None
+        self._pruned_at: float | None = None
+
+    def start(self) -> None:
+        if self._tasks or self.workers <= 0:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.workers)]
+
+    def wake(self) -> None:
+        """
+        새 작업 커밋 후 호출 (다음 확인 주기를 기다리지 않고 실행)
+        """
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                job = await self._claim()
+            except Exception:
+                logger.exception("Failed to claim a job")
+                job = None
+
+            if job is not None:
+                await self._execute(job)
+                continue
+
+            await self._prune()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _claim(self):
+        """
+        실행할 작업 하나를 running 으로 바꾸고 반환 (대기 작업 → 임대가 만료된 실행 중 작업 순)
+        """
+        from sqlalchemy import select, update
+
+        import database
+        from api.models import Job
+
+        now = _now()
+
+        def next_job(status: str):
+            return (
+                select(Job.job_id)
+                .where(Job.status == status, Job.run_after <= now)
+                .order_by(Job.run_after)
+                .limit(1)
+            )
+
+        # 할 일이 없을 때는 쓰기 잠금을 잡지 않도록 조회 세션에서 먼저 확인
+        async with database.ReadSessionLocal() as db:
+            ready = [
+                status for status in ("queued", "running")
+                if (await db.execute(next_job(status))).first() is not None
+            ]
+        if not ready:
+            return None
+
+        async with database.AsyncSessionLocal() as db:
+            for status in ready:
+                job = (
+                    await db.execute(
+                        update(Job)
+                        .where(Job.job_id == next_job(status).scalar_subquery())
+                        .values(
+                            status="running",
+                            attempts=Job.attempts + 1,
+                            run_after=now + timedelta(seconds=config.JOBS_LEASE_SECONDS),
+                        )
+                        .returning(Job.job_id, Job.kind, Job.payload, Job.attempts, Job.max_attempts)
+                    )
+                ).first()
+                if job is not None:
+                    await db.commit()
+                    return job
+        return None
+
+    async def _execute(self, job) -> None:
+        fn = _HANDLERS.get(job.kind)
+        try:
+            if fn is None:
+                raise LookupError(f"Unknown job kind: {job.kind}")
+            await asyncio.wait_for(fn(**json.loads(job.payload)), config.JOBS_LEASE_SECONDS)
+        except asyncio.CancelledError:
+            # 서버 종료: 다음 실행 때 바로 다시 실행되도록 대기 상태로 되돌림
+            await asyncio.shield(self._finish(job, "queued", run_after=_now()))
+            raise
+        except Exception as exc:
+            retry = fn is not None and job.attempts < job.max_attempts
+            logger.warning(
+                "Job %d (%s) failed on attempt %d/%d%s",
+                job.job_id, job.kind, job.attempts, job.max_attempts,
+                "; retrying" if retry else "", exc_info=True,
+            )
+            error = f"{type(exc).__name__}: {exc}"
+            if retry:
+                await self._finish(job, "queued", error, _now() + timedelta(seconds=backoff(job.attempts)))
+            else:
+                await self._finish(job, "failed", error)
+        else:
+            await self._finish(job, "done")
+
+    async def _finish(self, job, status: str, error: str | None = None, run_after: datetime | None = None) -> None:
+        from sqlalchemy import update
+
+        import database
+        from api.models import Job
+
+        values = {"status": status, "last_error": error}
+        if run_after is not None:
+            values["run_after"] = run_after
+        if status in ("done", "failed"):
+            values["finished_at"] = _now()
+        try:
+            async with database.AsyncSessionLocal() as db:
+                # 임대가 만료돼 다른 워커가 다시 가져간 작업이면 건드리지 않음
+                await db.execute(
+                    update(Job)
+                    .where(Job.job_id == job.job_id, Job.status == "running", Job.attempts == job.attempts)
+                    .values(**values)
+                )
+                await db.commit()
+        except Exception:
+            logger.exception("Failed to record job %d as %s", job.job_id, status)
+
+    async def _prune(self) -> None:
+        """
+        보관 시간이 지난 끝난 작업 삭제 (한 시간에 한 번)
+        """
+        if self._pruned_at is not None and time.monotonic() - self._pruned_at < 3600:
+            return
+        self._pruned_at = time.monotonic()
+
+        from sqlalchemy import delete
+
+        import database
+        from api.models import Job
+
+        cutoff = _now() - timedelta(hours=config.JOBS_RETENTION_HOURS)
+        try:
+            async with database.AsyncSessionLocal() as db:
+                for status in ("done", "failed"):
+                    await db.execute(delete(Job).where(Job.status == status, Job.finished_at < cutoff))
+                await db.commit()
+        except Exception:
+            logger.exception("Failed to prune finished jobs")
+
+    async def close(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._wakeup = None
+
+
+pool = JobPool(config.JOBS_WORKERS, config.JOBS_POLL_INTERVAL_MS / 1000)
@@ -0,0 +1,178 @@
+import asyncio
+import logging
+from collections import Counter
+
+from sqlalchemy import delete, literal, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import config
+import database
+from api.models import Like, Pin
+from services import counters
+from services import events
+from services.cache import read_cache
+
+logger = logging.getLogger(__name__)
+
+
+async def _insert(db: AsyncSession, user_id: int, pin_id: int) -> Row | None:
+    """
+    핀이 있을 때만 즐겨찾기 추가, 이미 있으면 아무것도 하지 않음 (한 번의 INSERT ... SELECT)
+    새로 추가된 경우에만 행 반환
+    """
+    stmt = (
+        sqlite_insert(Like)
+        .from_select(
+            ["user_id", "pin_id"],
+            select(literal(user_id), Pin.pin_id).where(Pin.pin_id == pin_id),
+        )
+        .on_conflict_do_nothing(index_elements=[Like.user_id, Like.pin_id])
+        .returning(Like.like_id, Like.user_id, Like.pin_id, Like.created_at, Like.updated_at)
+    )
+    return (await db.execute(stmt)).first()
+
+
+async def _delete(db: AsyncSession, user_id: int, pin_id: int) -> bool:
+    deleted = (
+        await db.execute(
+            delete(Like)
+            .where(Like.user_id == user_id, Like.pin_id == pin_id)
+            .returning(Like.like_id)
+        )
+    ).first()
+    return deleted is not None
+
+
+async def pin_exists(db: AsyncSession, pin_id: int) -> bool:
+    # 변경이 없었을 때만 호출 (핀 없음 / 이미 반영됨 구분용)
+    return (await db.execute(select(Pin.pin_id).where(Pin.pin_id == pin_id))).first() is not None
+
+
+async def like(db: AsyncSession, user_id: int, pin_id: int) -> Row | None:
+    """
+    즐겨찾기 추가 + 카운터 증가 (같은 트랜잭션, commit은 호출한 쪽)
+    """
+    row = await _insert(db, user_id, pin_id)
+    if row is not None:
+        await counters.adjust(db, pin_id, likes=1)
+        await read_cache.bump(db, f"pin:{pin_id}")
+    return row
+
+
+async def unlike(db: AsyncSession, user_id: int, pin_id: int) -> bool:
+    """
+    즐겨찾기 취소 + 카운터 감소 (실제로 지워진 경우에만)
+    """
+    removed = await _delete(db, user_id, pin_id)
+    if removed:
+        await counters.adjust(db, pin_id, likes=-1)
+        await read_cache.bump(db, f"pin:{pin_id}")
+    return removed
+
+
+class LikeBuffer:
+    """
+    즐겨찾기 write-behind 버퍼 (LIKE_WRITE_BEHIND=1 일 때 사용)
+
+    - 요청은 (user_id, pin_id) → 최종 상태만 메모리에 기록하고 바로 응답
+      (같은 사용자가 연속으로 누르면 마지막 상태만 반영)
+    - flush_interval 마다 또는 batch_size 만큼 쌓이면 한 트랜잭션으로 반영
+      → 인기 핀에 좋아요가 몰려도 요청마다 SQLite 쓰기 잠금을 잡지 않음
+    - 핀별 카운터는 배치당 한 번만 갱신
+    - 종료 시 close()로 남은 항목 반영 (프로세스가 강제 종료되면 유실될 수 있음)
+    """
+
+    def __init__(self, flush_interval: float, batch_size: int):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = batch_size * 10
+        self._pending: dict[tuple[int, int], bool] = {}
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._lock: asyncio.Lock | None = None
+        self._stopping = False
+
+    def _start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+            self._lock = asyncio.Lock()
+            self._task = asyncio.create_task(self._run())
+
+    async def submit(self, user_id: int, pin_id: int, liked: bool) -> None:
+        self._start()
+        # 반영이 밀리면 요청이 기다리도록 함 (메모리 무한 증가 방지)
+        if len(self._pending) >= self.max_pending:
+            await self.flush()
+
+        self._pending[(user_id, pin_id)] = liked
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        if self._lock is None:
+            return
+        async with self._lock:
+            while self._pending:
+                keys = list(self._pending)[: self.batch_size]
+                batch = [(key, self._pending.pop(key)) for key in keys]
+                try:
+                    await self._apply(batch)
+                except asyncio.CancelledError:
+                    self._restore(batch)
+                    raise
+                except Exception:
+                    logger.exception("Failed to flush %d like events", len(batch))
+                    self._restore(batch)
+                    return
+
+    def _restore(self, batch: list[tuple[tuple[int, int], bool]]) -> None:
+        # 그 사이 새 요청이 없던 항목만 다시 대기열로
+        for key, liked in batch:
+            self._pending.setdefault(key, liked)
+
+    async def _apply(self, batch: list[tuple[tuple[int, int], bool]]) -> None:
+        deltas: Counter[int] = Counter()
+        applied = [] # 실제로 바뀐 항목만 커밋 후 이벤트 발행
+        async with database.AsyncSessionLocal() as db:
+            for (user_id, pin_id), liked in batch:
+                if liked and await _insert(db, user_id, pin_id) is not None:
+                    deltas[pin_id] += 1
+                elif not liked and await _delete(db, user_id, pin_id):
+                    deltas[pin_id] -= 1
+                else:
+                    continue
+                applied.append((user_id, pin_id, liked))
+
+            for pin_id, delta in deltas.items():
+                if delta:
+                    await counters.adjust(db, pin_id, likes=delta)
+            await read_cache.bump(db, *(f"pin:{pin_id}" for pin_id in deltas))
+            await db.commit()
+
+        for user_id, pin_id, liked in applied:
+            events.hub.publish(pin_id, "like.created" if liked else "like.deleted", {"pin_id": pin_id, "user_id": user_id})
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        # 취소하지 않고 멈춤 표시 → 반영 중인 배치는 끝까지 쓰고 종료
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        await self.flush()
+
+
+buffer = LikeBuffer(config.LIKE_FLUSH_INTERVAL_MS / 1000, config.LIKE_FLUSH_BATCH)
@@ -0,0 +1,160 @@
+import hashlib
+import mimetypes
+import os
+import re
+import stat
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+import config
+
+# 업로드 파일명은 한 번 정해지면 내용이 바뀌지 않으므로 영구 캐시
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+# 내용 해시 기반 파일명: <sha256>.<ext> / variants/<sha256>_<width>.<ext>
+_CONTENT_ADDRESSED = re.compile(r"(?:variants/)?([0-9a-f]{64}(?:_\d+)?)\.\w+")
+
+# 미리 압축된 파일(<파일>.br / <파일>.gz)이 있으면 우선 사용
+_PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+@dataclass(frozen=True)
+class _Entry:
+    full_path: str
+    stat_result: os.stat_result
+    etag: str
+    media_type: str
+    encodings: tuple[tuple[str, str, os.stat_result], ...] # (encoding, path, stat)
+    expires_at: float
+
+
+def _file_digest(full_path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(full_path, "rb") as f:
+        while chunk := f.read(64 * 1024):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in tags
+
+
+class MediaFiles(StaticFiles):
+    """
+    /src 업로드 이미지 서빙
+    - Cache-Control: immutable + 내용 해시 ETag (If-None-Match → 304)
+    - Range 요청은 FileResponse가 처리
+    - 경로별 메타데이터(stat, ETag)를 LRU에 보관해 재요청 시 디스크 조회 생략
+    """
+
+    def __init__(self, *, directory: str, max_entries: int = config.MEDIA_CACHE_ENTRIES, ttl: int = config.MEDIA_CACHE_TTL):
+        super().__init__(directory=directory)
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl
+
+    def _cached(self, path: str) -> _Entry | None:
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        if entry.expires_at < time.monotonic():
+            del self._entries[path]
+            return None
+        self._entries.move_to_end(path)
+        return entry
+
+    def _store(self, path: str, entry: _Entry) -> None:
+        self._entries[path] = entry
+        self._entries.move_to_end(path)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, path: str) -> _Entry | None:
+        """
+        파일 정보 조회 (스레드에서 실행)
+        """
+        # 업로드 중인 임시 파일(.upload-*.tmp) 등 숨김 파일은 서빙하지 않음
+        if any(part.startswith(".") for part in path.split("/")):
+            return None
+
+        try:
+            full_path, stat_result = self.lookup_path(path)
+        except (OSError, ValueError):
+            return None
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            return None
+
+        match = _CONTENT_ADDRESSED.fullmatch(path)
+        digest = match.group(1) if match else _file_digest(full_path)
+
+        encodings = []
+        for encoding, suffix in _PRECOMPRESSED:
+            try:
+                encodings.append((encoding, full_path + suffix, os.stat(full_path + suffix)))
+            except FileNotFoundError:
+                continue
+
+        return _Entry(
+            full_path=full_path,
+            stat_result=stat_result,
+            etag=f'"{digest}"',
+            media_type=mimetypes.guess_type(full_path)[0] or "application/octet-stream",
+            encodings=tuple(encodings),
+            expires_at=time.monotonic() + self._ttl,
+        )
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405, headers={"Allow": "GET, HEAD"})
+
+        entry = self._cached(path)
+        cache_hit = entry is not None
+        if entry is None:
+            entry = await anyio.to_thread.run_sync(self._load, path)
+            if entry is None:
+                raise HTTPException(status_code=404)
+            self._store(path, entry)
+
+        request_headers = Headers(scope=scope)
+        headers = {"Cache-Control": IMMUTABLE}
+        if entry.encodings:
+            headers["Vary"] = "Accept-Encoding"
+
+        # 요청 인코딩에 맞는 미리 압축된 파일 선택
+        accepted = request_headers.get("accept-encoding", "")
+        file_path, stat_result, etag = entry.full_path, entry.stat_result, entry.etag
+        for encoding, encoded_path, encoded_stat in entry.encodings:
+            if encoding in accepted:
+                file_path, stat_result = encoded_path, encoded_stat
+                etag = f'{entry.etag[:-1]}-{encoding}"'
+                headers["Content-Encoding"] = encoding
+                break
+        headers["ETag"] = etag
+
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match and etag_matches(etag, if_none_match):
+            return Response(status_code=304, headers=headers)
+
+        # 본문을 보낼 때는 캐시된 파일이 GC로 지워졌는지 확인
+        if cache_hit and not await anyio.to_thread.run_sync(os.path.exists, file_path):
+            self._entries.pop(path, None)
+            raise HTTPException(status_code=404)
+
+        return FileResponse(
+            file_path,
+            stat_result=stat_result,
+            media_type=entry.media_type,
+            headers=headers,
+        )
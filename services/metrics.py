@@ -0,0 +1,195 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import Headers
+
+import config
+from services import events
+from services.cache import read_cache
+
+logger = logging.getLogger(__name__)
+
+# 지연시간 히스토그램 구간 (초)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class RequestStats:
+    """
+    요청 하나에서 실행된 쿼리 수 / DB 시간
+    (contextvar로 요청별 분리, 백그라운드 작업 쿼리도 포함)
+    """
+    queries: int = 0
+    db_seconds: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+@dataclass
+class _Histogram:
+    buckets: list[int] = field(default_factory=lambda: [0] * len(BUCKETS))
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.buckets[i] += 1
+        self.total += value
+        self.count += 1
+
+
+class Registry:
+    """
+    워커 프로세스별 요청 지표 (Prometheus 텍스트 형식으로 출력)
+    """
+
+    def __init__(self):
+        self.latency: dict[tuple[str, str], _Histogram] = {}
+        self.requests: Counter[tuple[str, str, str]] = Counter()
+        self.db_queries: Counter[tuple[str, str]] = Counter()
+        self.db_seconds: Counter[tuple[str, str]] = Counter()
+        self.n_plus_one: Counter[tuple[str, str]] = Counter()
+
+    def record(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        key = (method, route)
+        self.latency.setdefault(key, _Histogram()).observe(seconds)
+        self.requests[(method, route, str(status))] += 1
+        self.db_queries[key] += stats.queries
+        self.db_seconds[key] += stats.db_seconds
+
+        if stats.queries > config.METRICS_QUERY_WARN_THRESHOLD:
+            self.n_plus_one[key] += 1
+            statement, repeats = stats.statements.most_common(1)[0]
+            logger.warning(
+                "%s %s issued %d queries (most repeated x%d: %s)",
+                method, route, stats.queries, repeats, " ".join(statement.split())[:200],
+            )
+
+    def render(self) -> str:
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by route template",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), histogram in sorted(self.latency.items()):
+            labels = f'method="{method}",route="{route}"'
+            for bound, count in zip(BUCKETS, histogram.buckets):
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {histogram.total:.6f}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {histogram.count}")
+
+        lines += ["# HELP http_requests_total Requests by route template and status", "# TYPE http_requests_total counter"]
+        for (method, route, status), count in sorted(self.requests.items()):
+            lines.append(f'http_requests_total{{method="{method}",route="{route}",status="{status}"}} {count}')
+
+        for name, help_text, values, fmt in (
+            ("db_queries_total", "SQL statements executed", self.db_queries, "{}"),
+            ("db_query_seconds_total", "Time spent executing SQL", self.db_seconds, "{:.6f}"),
+            ("db_query_warnings_total", "Requests over the query count threshold (possible N+1)", self.n_plus_one, "{}"),
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for (method, route), value in sorted(values.items()):
+                lines.append(f'{name}{{method="{method}",route="{route}"}} ' + fmt.format(value))
+
+        cache = read_cache.snapshot()
+        for key in ("hits", "misses", "evictions", "invalidations"):
+            lines += [f"# TYPE read_cache_{key}_total counter", f"read_cache_{key}_total {cache[key]}"]
+        lines += ["# TYPE read_cache_entries gauge", f"read_cache_entries {cache['size']}"]
+
+        hub = events.hub.snapshot()
+        lines += [
+            "# TYPE pin_event_subscribers gauge", f"pin_event_subscribers {hub['subscribers']}",
+            "# TYPE pin_event_dropped_total counter", f"pin_event_dropped_total {hub['dropped']}",
+        ]
+
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+# --- SQLAlchemy 쿼리 계측 (모든 엔진) ---
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 시작 시각은 실행 context 에 저장 (쿼리가 실패하면 after 이벤트가 없으므로 커넥션에 쌓이지 않도록)
+    if context is not None:
+        context._query_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_start", None)
+    stats = _current.get()
+    if stats is not None and started is not None:
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started
+        stats.statements[statement] += 1
+
+
+def _route_template(scope) -> str:
+    """
+    경로 그대로 쓰면 라벨 수가 무한히 늘어나므로 매칭된 라우트 템플릿 사용
+    """
+    route = scope.get("route")
+    path = scope["path"]
+    if route is None:
+        # StaticFiles 같은 마운트는 라우트 정보 없이 root_path만 남음
+        root_path = scope.get("root_path")
+        return f"{root_path}/{{path}}" if root_path else "unmatched"
+    # include_router 한 라우트는 prefix가 빠진 경로만 갖고 있으므로 요청 경로에서 prefix 복원
+    for index, char in enumerate(path):
+        if char == "/" and route.path_regex.match(path[index:]):
+            return path[:index] + route.path
+    return route.path
+
+
+class MetricsMiddleware:
+    """
+    요청별 지연시간 / 쿼리 수 / DB 시간 기록
+    응답에 Server-Timing 헤더 추가 (브라우저 개발자 도구 Timing 탭에서 확인)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        finished = None
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status, finished
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if Headers(raw=message.get("headers", [])).get("content-type", "").startswith("text/event-stream"):
+                    # SSE 는 연결 유지 시간 대신 스트림 시작까지의 시간만 기록
+                    finished = time.perf_counter()
+                elapsed = (time.perf_counter() - started) * 1000
+                timing = (
+                    f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries", '
+                    f"app;dur={elapsed:.1f}"
+                )
+                message.setdefault("headers", []).append((b"server-timing", timing.encode()))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            registry.record(
+                scope["method"], _route_template(scope), status, (finished or time.perf_counter()) - started, stats
+            )
@@ -0,0 +1,97 @@
+import base64
+import binascii
+import json
+import math
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import String, tuple_, type_coerce
+
+# 페이지 크기 기본값 / 상한
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def _format_timestamp(value: datetime) -> str:
+    """
+    SQLite에 저장된 텍스트 형식 그대로 변환
+    (CURRENT_TIMESTAMP는 마이크로초 없이 저장됨)
+    """
+    if value.microsecond:
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    정렬 키 값을 불투명한(opaque) 커서 문자열로 인코딩
+    """
+    payload = [_format_timestamp(v) if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _matches(value: Any, expected: type) -> bool:
+    """
+    커서 값이 정렬 키 타입과 맞는지 확인
+    datetime: 저장된 타임스탬프 텍스트, float: 유한한 숫자(정수 포함), int: 정수 (bool 제외)
+    """
+    if isinstance(value, bool):
+        return False
+    if expected is datetime:
+        if not isinstance(value, str):
+            return False
+        try:
+            datetime.fromisoformat(value)
+        except ValueError:
+            return False
+        return True
+    if expected is float:
+        return isinstance(value, (int, float)) and math.isfinite(value)
+    return isinstance(value, expected)
+
+
+def decode_cursor(cursor: str, *types: type) -> list[Any]:
+    """
+    커서 문자열을 정렬 키 값 목록으로 디코딩 (types: 정렬 키별 타입)
+    형식이나 타입이 맞지 않으면 400 에러
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if (
+        not isinstance(values, list)
+        or len(values) != len(types)
+        or not all(_matches(v, t) for v, t in zip(values, types))
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return values
+
+
+def keyset_after(columns: Sequence[Any], values: Sequence[Any], descending: bool = True):
+    """
+    (정렬 컬럼..., id) 기준으로 커서 다음 행만 남기는 WHERE 조건
+    """
+    # 타임스탬프는 저장된 텍스트와 그대로 비교
+    bound = [type_coerce(v, String) if isinstance(v, str) else v for v in values]
+    if descending:
+        return tuple_(*columns) < tuple_(*bound)
+    return tuple_(*columns) > tuple_(*bound)
+
+
+def paginate(rows: Sequence[Any], limit: int, key: Callable[[Any], tuple]) -> dict:
+    """
+    limit + 1 개 조회 결과로 페이지 응답 생성
+    남은 행이 있으면 마지막 항목 기준 next_cursor 포함
+    """
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit and items:
+        next_cursor = encode_cursor(*key(items[-1]))
+
+    return {"items": items, "next_cursor": next_cursor}
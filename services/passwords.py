@@ -0,0 +1,92 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from fastapi import HTTPException
+
+import config
+
+
+@functools.cache
+def _context():
+    """
+    passlib CryptContext (import가 무거워 처음 해시할 때 생성)
+    bcrypt 대신 pbkdf2_sha256 사용
+    min/max를 기본값과 같게 두어 반복 횟수가 바뀌면 needs_update()가 True가 됨
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["pbkdf2_sha256"],
+        deprecated="auto",
+        pbkdf2_sha256__default_rounds=config.PASSWORD_ROUNDS,
+        pbkdf2_sha256__min_rounds=config.PASSWORD_ROUNDS,
+        pbkdf2_sha256__max_rounds=config.PASSWORD_ROUNDS,
+    )
+
+
+class HashPool:
+    """
+    해시 계산 전용 스레드 풀
+    hashlib의 pbkdf2_hmac은 GIL을 놓고 계산하므로 스레드로도 병렬 처리됨
+    실행 중 + 대기 중 작업이 한도를 넘으면 바로 503으로 거절
+    """
+
+    def __init__(self, workers: int, queue_depth: int):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if not self._slots.acquire(blocking=False):
+            raise HTTPException(
+                status_code=503,
+                detail="Server busy, try again later",
+                headers={"Retry-After": "1"},
+            )
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        # 요청이 취소돼도 스레드 작업이 끝날 때 슬롯 반환
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool = HashPool(config.PASSWORD_HASH_WORKERS, config.PASSWORD_HASH_QUEUE_DEPTH)
+
+
+def _hash(pw: str) -> str:
+    return _context().hash(pw)
+
+
+def _verify(pw: str, hashed: str) -> tuple[bool, str | None]:
+    return _context().verify_and_update(pw, hashed)
+
+
+# 해시
+async def hash_password(pw: str) -> str:
+    return await _pool.run(_hash, pw)
+
+
+# 검증 (+ 해시 파라미터가 바뀌었으면 새 해시 반환)
+async def verify_password(pw: str, hashed: str) -> tuple[bool, str | None]:
+    return await _pool.run(_verify, pw, hashed)
+
+
+def preload() -> None:
+    """
+    서버 시작 후 별도 스레드에서 passlib 미리 로드 (시작을 기다리게 하지 않음)
+    """
+    threading.Thread(target=_context, name="password-preload", daemon=True).start()
+
+
+def shutdown() -> None:
+    _pool.shutdown()
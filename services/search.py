@@ -0,0 +1,99 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import column, table
+
+from api.models import Pin
+from services.pagination import keyset_after
+
+# 핀 검색용 FTS5 인덱스 (rowid = pin_id, 테이블은 마이그레이션 c41f0a8e5d27 에서 생성)
+FTS_TABLE = "pins_fts"
+
+# BM25 컬럼 가중치 (제목 > 본문)
+TITLE_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+
+pins_fts = table(FTS_TABLE, column("rowid"), column("title"), column("content"))
+
+
+def build_match(search: str) -> str | None:
+    """
+    사용자 입력을 FTS5 MATCH 식으로 변환
+    각 단어를 따옴표로 감싸 접두어 검색(AND)으로 만든다
+    """
+    terms = [t.replace('"', '""') for t in search.split()]
+    if not terms:
+        return None
+    return " ".join(f'"{t}"*' for t in terms)
+
+
+async def index_pin(db: AsyncSession, pin: Pin) -> None:
+    """
+    핀 제목/본문을 검색 인덱스에 반영 (같은 트랜잭션에서 호출)
+    """
+    await remove_pin(db, pin.pin_id)
+    await db.execute(
+        text(f"INSERT INTO {FTS_TABLE} (rowid, title, content) VALUES (:pin_id, :title, :content)"),
+        {"pin_id": pin.pin_id, "title": pin.title, "content": pin.content},
+    )
+
+
+async def remove_pin(db: AsyncSession, pin_id: int) -> None:
+    """
+    검색 인덱스에서 핀 제거
+    """
+    await db.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :pin_id"), {"pin_id": pin_id})
+
+
+def now_text() -> str:
+    """
+    최신순 가중치 계산 기준 시각 (SQLite CURRENT_TIMESTAMP 형식, UTC)
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def search_statement(match: str, recency: float, now: str, cursor: list | None, limit: int, columns: list):
+    """
+    BM25 점수(낮을수록 관련도 높음) 순으로 정렬된 검색 쿼리
+    recency > 0 이면 점수를 (1 + recency * 경과일수)로 나눠 오래된 핀을 뒤로 보낸다
+    결과 행: (columns..., score)
+    """
+    score = func.bm25(literal_column(FTS_TABLE), TITLE_WEIGHT, CONTENT_WEIGHT)
+    if recency:
+        age_days = func.julianday(now) - func.julianday(Pin.updated_at)
+        score = score / (1 + recency * age_days)
+
+    # 점수 계산에는 id만 쓰고, 응답 컬럼은 페이지에 남은 핀만 읽음
+    ranked = (
+        select(Pin.pin_id, score.label("score"))
+        .join_from(pins_fts, Pin, Pin.pin_id == pins_fts.c.rowid)
+        .where(literal_column(FTS_TABLE).match(match))
+        .subquery()
+    )
+
+    stmt = (
+        select(*columns, ranked.c.score)
+        .join_from(ranked, Pin, Pin.pin_id == ranked.c.pin_id)
+        .order_by(ranked.c.score, ranked.c.pin_id)
+    )
+    if cursor:
+        stmt = stmt.where(
+            keyset_after((ranked.c.score, ranked.c.pin_id), cursor, descending=False)
+        )
+
+    return stmt.limit(limit + 1)
+
+
+def rebuild(db: Session) -> int:
+    """
+    pins 테이블 전체로 검색 인덱스를 다시 생성 (관리 스크립트용, 동기 세션)
+    """
+    db.execute(_CREATE_FTS)
+    db.execute(text(f"DELETE FROM {FTS_TABLE}"))
+    result = db.execute(
+        text(f"INSERT INTO {FTS_TABLE} (rowid, title, content) SELECT pin_id, title, content FROM pins")
+    )
+    db.execute(text(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')"))
+    return result.rowcount
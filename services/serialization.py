@@ -0,0 +1,167 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from api.models import Comment, Pin
+from schemas import variant_urls
+from services.media import etag_matches
+
+# orjson이 없으면 표준 json으로 인코딩 (결과는 같고 속도만 느림)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 목록 응답에 필요한 컬럼만 조회 (ORM 객체 / Pydantic 검증 없이 바로 dict 생성)
+# 순서는 pin_item / comment_item 의 언패킹 순서와 같아야 함
+def pin_columns(entity=Pin) -> list:
+    return [
+        entity.pin_id,
+        entity.user_id,
+        entity.title,
+        entity.content,
+        entity.image,
+        entity.variant_widths,
+        entity.like_count,
+        entity.comment_count,
+        entity.created_at,
+        entity.updated_at,
+    ]
+
+
+# 그리드 타일용 (content 같은 큰 컬럼은 읽지 않음)
+def pin_summary_columns(entity=Pin) -> list:
+    return [
+        entity.pin_id,
+        entity.user_id,
+        entity.title,
+        entity.image,
+        entity.variant_widths,
+    ]
+
+
+COMMENT_COLUMNS = (
+    Comment.comment_id,
+    Comment.user_id,
+    Comment.pin_id,
+    Comment.content,
+    Comment.created_at,
+    Comment.updated_at,
+)
+
+
+def pin_item(row) -> dict:
+    """
+    pin_columns() 조회 행 → PinResponse 와 같은 형태의 dict
+    (뒤에 붙은 정렬 키 컬럼은 무시)
+    """
+    pin_id, user_id, title, content, image, widths, like_count, comment_count, created_at, updated_at = row[:10]
+    return {
+        "pin_id": pin_id,
+        "user_id": user_id,
+        "title": title,
+        "content": content,
+        "image": image,
+        "image_variants": variant_urls(image, widths),
+        "like_count": like_count,
+        "comment_count": comment_count,
+        "created_at": created_at,
+        "updated_at": updated_at,
+    }
+
+
+def pin_summary_item(row) -> dict:
+    """
+    pin_summary_columns() 조회 행 → PinSummary 와 같은 형태의 dict
+    """
+    pin_id, user_id, title, image, widths = row[:5]
+    return {
+        "pin_id": pin_id,
+        "user_id": user_id,
+        "title": title,
+        "image": image,
+        "image_variants": variant_urls(image, widths),
+    }
+
+
+# view 쿼리 파라미터 → (조회 컬럼, 행 → dict)
+PIN_VIEWS = {
+    "full": (pin_columns, pin_item),
+    "summary": (pin_summary_columns, pin_summary_item),
+}
+
+
+def comment_item(row) -> dict:
+    """
+    COMMENT_COLUMNS 조회 행 → CommentResponse 와 같은 형태의 dict
+    """
+    comment_id, user_id, pin_id, content, created_at, updated_at = row[:6]
+    return {
+        "comment_id": comment_id,
+        "user_id": user_id,
+        "pin_id": pin_id,
+        "content": content,
+        "created_at": created_at,
+        "updated_at": updated_at,
+    }
+
+
+def _default(value: Any):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    응답 본문 인코딩 (datetime은 Pydantic과 같은 ISO 8601 형식)
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(Response):
+    """
+    response_model 검증을 거치지 않는 JSON 응답
+    DB에서 바로 만든 dict 또는 이미 인코딩된 bytes(캐시)를 그대로 응답
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+@dataclass(frozen=True)
+class Encoded:
+    """
+    인코딩된 응답 본문 + 약한 ETag (조회 캐시에 그대로 저장)
+    ETag는 본문 해시라 워커가 달라도 내용이 같으면 같은 값
+    """
+    body: bytes
+    etag: str
+
+
+def encode(content: Any) -> Encoded:
+    body = dumps(content)
+    # 압축 여부와 관계없이 같은 값을 쓰므로 약한(W/) ETag
+    return Encoded(body, f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+
+
+def conditional_response(request: Request, encoded: Encoded) -> Response:
+    """
+    If-None-Match 가 ETag와 같으면 본문 없이 304, 아니면 JSON 응답
+    """
+    headers = {"ETag": encoded.etag}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(encoded.etag.removeprefix("W/"), if_none_match):
+        return Response(status_code=304, headers=headers)
+    return FastJSONResponse(encoded.body, headers=headers)
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import select, update
+
+import config
+from services import jobs
+from services.uploads import UPLOAD_DIR
+
+logger = logging.getLogger(__name__)
+
+# 리사이즈 이미지 저장 폴더 (/src/variants 로 서빙)
+VARIANT_DIR = os.path.join(UPLOAD_DIR, "variants")
+
+_EXTENSIONS = {"webp": "webp", "jpeg": "jpg"}
+
+
+def variant_filename(digest: str, width: int) -> str:
+    return f"{digest}_{width}.{_EXTENSIONS[config.IMAGE_VARIANT_FORMAT]}"
+
+
+def render_variants(source: str, digest: str, widths: tuple[int, ...], fmt: str) -> list[int]:
+    """
+    원본보다 작은 너비마다 리사이즈 이미지 생성 (작업 프로세스에서 실행)
+    반환값: 생성된 너비 목록
+    """
+    from PIL import Image as PILImage, ImageOps
+
+    os.makedirs(VARIANT_DIR, exist_ok=True)
+    done = []
+    with PILImage.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        if fmt == "jpeg" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        for width in sorted(widths):
+            if width >= image.width:
+                break
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), PILImage.Resampling.LANCZOS)
+
+            target = os.path.join(VARIANT_DIR, variant_filename(digest, width))
+            tmp = f"{target}.tmp"
+            resized.save(tmp, format=fmt.upper(), quality=80)
+            os.replace(tmp, target)
+            done.append(width)
+
+    return done
+
+
+class ThumbnailWorker:
+    """
+    리사이즈 전용 프로세스 풀 (CPU 작업이 이벤트 루프/GIL을 막지 않도록)
+    첫 작업 때 생성
+    """
+
+    def __init__(self, workers: int):
+        self._workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # aiosqlite 스레드가 있는 프로세스를 fork 하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def run(self, *args) -> list[int]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool(), render_variants, *args)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+worker = ThumbnailWorker(config.THUMBNAIL_WORKERS)
+
+
+@jobs.handler("thumbnails.generate")
+async def generate(url: str, digest: str) -> None:
+    """
+    업로드 응답 후 작업 큐에서 리사이즈 이미지 생성 (실패하면 작업 큐가 재시도)
+    완료되면 images.variants 에 생성된 너비 기록 → PinResponse 가 변형 URL 사용
+    """
+    from api.models import Image, Pin
+    from database import AsyncSessionLocal, ReadSessionLocal
+    from services.cache import read_cache
+
+    # 같은 이미지(중복 업로드)는 이미 생성돼 있으면 건너뜀
+    # 리사이즈 중에는 트랜잭션(쓰기 잠금)을 잡고 있지 않도록 조회 세션을 먼저 닫음
+    async with ReadSessionLocal() as db:
+        existing = (
+            await db.execute(select(Image.variants).where(Image.digest == digest))
+        ).scalar_one_or_none()
+    if existing is not None:
+        return
+
+    source = os.path.join(UPLOAD_DIR, os.path.basename(url))
+    try:
+        widths = await worker.run(
+            source, digest, config.IMAGE_VARIANT_WIDTHS, config.IMAGE_VARIANT_FORMAT
+        )
+    except ImportError:
+        # 재시도해도 같으므로 작업은 완료 처리
+        logger.warning("Pillow is not installed; serving original images only")
+        return
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(Image)
+            .where(Image.digest == digest)
+            .values(variants=",".join(str(w) for w in widths))
+        )
+        # 이 이미지를 쓰는 핀의 캐시된 응답에 변형 URL 반영
+        pin_ids = (
+            await db.execute(select(Pin.pin_id).where(Pin.image == url))
+        ).scalars().all()
+        await read_cache.bump(db, *(f"pin:{pin_id}" for pin_id in pin_ids))
+        await db.commit()
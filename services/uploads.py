@@ -0,0 +1,99 @@
+import contextlib
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+
+import anyio
+from fastapi import HTTPException, UploadFile
+
+import config
+
+# 업로드 파일 저장 폴더 (/src 로 서빙)
+UPLOAD_DIR = "src"
+# 한 번에 읽고 쓰는 크기 → 업로드 크기와 상관없이 메모리 사용량 일정
+CHUNK_SIZE = 64 * 1024
+
+
+def sniff_image_type(head: bytes) -> str | None:
+    """
+    파일 앞부분(매직 넘버)으로 이미지 형식 판별
+    파일명/Content-Type 헤더는 신뢰하지 않음
+    """
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+@dataclass(frozen=True)
+class StoredImage:
+    url: str # /src/<digest>.<ext>
+    digest: str # 내용 sha256
+    size: int
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(status_code=413, detail="Image too large")
+
+
+def _commit_blob(tmp_path: str, final_path: str) -> None:
+    """
+    같은 내용의 파일이 이미 있으면 임시 파일을 버리고(중복 제거) 수정 시각만 갱신
+    GC가 방금 재사용된 파일을 지우지 않도록 mtime을 유예 기간 기준으로 사용
+    """
+    if os.path.exists(final_path):
+        os.remove(tmp_path)
+        os.utime(final_path)
+    else:
+        os.replace(tmp_path, final_path)
+
+
+async def save_upload(image: UploadFile) -> StoredImage:
+    """
+    업로드 이미지를 청크 단위로 임시 파일에 쓰면서 sha256을 계산하고,
+    검증이 끝나면 내용 해시 이름(<digest>.<ext>)으로 원자적으로 rename
+    실패하면 임시 파일 삭제
+    """
+    # 크기를 알 수 있으면 읽기 전에 거절
+    if image.size is not None and image.size > config.MAX_UPLOAD_BYTES:
+        raise _too_large()
+
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    tmp_path = os.path.join(UPLOAD_DIR, f".upload-{uuid.uuid4().hex}.tmp")
+
+    try:
+        ext = None
+        size = 0
+        hasher = hashlib.sha256()
+        async with await anyio.open_file(tmp_path, "wb") as buffer:
+            while chunk := await image.read(CHUNK_SIZE):
+                if ext is None:
+                    ext = sniff_image_type(chunk)
+                    if ext is None:
+                        raise HTTPException(status_code=415, detail="Unsupported image type")
+
+                size += len(chunk)
+                if size > config.MAX_UPLOAD_BYTES:
+                    raise _too_large()
+
+                hasher.update(chunk)
+                await buffer.write(chunk)
+
+        if ext is None:
+            raise HTTPException(status_code=400, detail="Empty image")
+
+        digest = hasher.hexdigest()
+        filename = f"{digest}.{ext}"
+        await anyio.to_thread.run_sync(_commit_blob, tmp_path, os.path.join(UPLOAD_DIR, filename))
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+    return StoredImage(url=f"/src/{filename}", digest=digest, size=size)
@@ -0,0 +1,85 @@
+import itertools
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# 저장소 루트에 __init__.py 가 있어 pytest가 루트를 sys.path 에 넣지 않으므로 직접 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# 테스트 중 database import 가 저장소의 pinter5t.db 를 쓰지 않도록 임시 DB 사용
+TMP_DIR = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{TMP_DIR}/test.db")
+
+_emails = itertools.count(1)
+
+# 1x1 GIF (핀 등록에는 이미지가 필요)
+GIF = (
+    b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00"
+    b",\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    head 까지 마이그레이션한 임시 DB로 앱 실행 (lifespan 포함)
+    업로드 파일이 저장소 src/ 에 남지 않도록 임시 폴더에서 실행
+    """
+    from fastapi.testclient import TestClient
+
+    from bench.seed import migrate
+
+    migrate(os.environ["DATABASE_URL"])
+    cwd = os.getcwd()
+    os.chdir(TMP_DIR)
+    os.makedirs("src", exist_ok=True)
+
+    import main
+
+    with TestClient(main.app) as test_client:
+        yield test_client
+    os.chdir(cwd)
+
+
+@pytest.fixture
+def make_user(client):
+    def make() -> int:
+        n = next(_emails)
+        response = client.post(
+            "/api/users/signup",
+            json={"email": f"user{n}@example.com", "username": f"user{n}", "password": "password"},
+        )
+        assert response.status_code == 201
+        return response.json()["user_id"]
+    return make
+
+
+@pytest.fixture
+def make_pin(client):
+    def make(user_id: int, title: str = "pin") -> int:
+        response = client.post(
+            "/api/pins/",
+            data={"user_id": user_id, "title": title, "content": "content"},
+            files={"image": ("pin.gif", GIF, "image/gif")},
+        )
+        assert response.status_code == 201
+        return response.json()["pin_id"]
+    return make
+
+
+def walk(client, url: str, **params) -> list[dict]:
+    """
+    next_cursor 를 따라 모든 페이지의 항목을 모음
+    """
+    items, cursor = [], None
+    while True:
+        page = client.get(url, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert page.status_code == 200
+        body = page.json()
+        items += body["items"]
+        cursor = body["next_cursor"]
+        if not cursor:
+            return items
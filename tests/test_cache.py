@@ -0,0 +1,43 @@
+from sqlalchemy import update
+
+import database
+from api.models import Pin
+from services.cache import invalidate_statement, read_cache
+
+
+def test_write_invalidates_cached_pin(client, make_user, make_pin):
+    user_id = make_user()
+    pin_id = make_pin(user_id, title="before")
+    assert client.get(f"/api/pins/{pin_id}").json()["title"] == "before"
+    hits = read_cache.stats.hits
+    assert client.get(f"/api/pins/{pin_id}").json()["title"] == "before"
+    assert read_cache.stats.hits == hits + 1
+
+    client.put(f"/api/pins/{pin_id}", data={"user_id": user_id, "title": "after"})
+    assert client.get(f"/api/pins/{pin_id}").json()["title"] == "after"
+
+
+def test_write_from_another_connection_invalidates_cached_pin(client, make_user, make_pin):
+    pin_id = make_pin(make_user(), title="before")
+    assert client.get(f"/api/pins/{pin_id}").json()["title"] == "before"
+
+    # 다른 워커의 쓰기: 별도 커넥션에서 수정 + 무효화 기록
+    with database.SessionLocal() as db:
+        db.execute(update(Pin).where(Pin.pin_id == pin_id).values(title="elsewhere"))
+        db.execute(invalidate_statement(f"pin:{pin_id}"))
+        db.commit()
+
+    assert client.get(f"/api/pins/{pin_id}").json()["title"] == "elsewhere"
+
+
+def test_sync_runs_once_per_request(client, make_user, make_pin, monkeypatch):
+    user_id = make_user()
+    pin_ids = [make_pin(user_id) for _ in range(3)]
+
+    calls = []
+    poll = read_cache._poll
+    monkeypatch.setattr(read_cache, "_poll", lambda seen: calls.append(seen) or poll(seen))
+
+    response = client.get("/api/pins/batch", params={"ids": pin_ids})
+    assert response.status_code == 200
+    assert len(calls) == 1
@@ -0,0 +1,46 @@
+def test_pin_detail_returns_304_until_pin_changes(client, make_user, make_pin):
+    user_id = make_user()
+    pin_id = make_pin(user_id, title="before")
+    url = f"/api/pins/{pin_id}"
+
+    first = client.get(url)
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    # 캐시 적중/미스, 약한 비교, 여러 값 모두 304
+    for if_none_match in (etag, etag.removeprefix("W/"), f'"other", {etag}', "*"):
+        response = client.get(url, headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    client.put(url, data={"user_id": user_id, "title": "after"})
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["title"] == "after"
+    assert changed.headers["ETag"] != etag
+
+
+def test_etag_does_not_depend_on_compression(client, make_user, make_pin):
+    user_id = make_user()
+    for _ in range(8):
+        make_pin(user_id)
+    plain = client.get("/api/pins/", params={"limit": 50}, headers={"Accept-Encoding": "identity"})
+    gzipped = client.get("/api/pins/", params={"limit": 50}, headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert plain.headers["ETag"] == gzipped.headers["ETag"]
+    assert client.get(
+        "/api/pins/", params={"limit": 50}, headers={"If-None-Match": plain.headers["ETag"]}
+    ).status_code == 304
+
+
+def test_pin_list_etag_changes_after_new_pin(client, make_user, make_pin):
+    user_id = make_user()
+    make_pin(user_id)
+    etag = client.get("/api/pins/").headers["ETag"]
+    assert client.get("/api/pins/", headers={"If-None-Match": etag}).status_code == 304
+
+    make_pin(user_id, title="newer")
+    response = client.get("/api/pins/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["items"][0]["title"] == "newer"
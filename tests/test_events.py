@@ -0,0 +1,42 @@
+from services.events import EventHub
+
+
+def _hub(grace: float = 60) -> EventHub:
+    return EventHub(queue_size=10, buffer_size=5, max_channels=100, heartbeat=1, grace=grace)
+
+
+def _event_id(frame: bytes) -> str:
+    return frame.split(b"\n", 1)[0].removeprefix(b"id: ").decode()
+
+
+def test_publish_without_subscribers_keeps_nothing():
+    hub = _hub()
+    for pin_id in range(50):
+        hub.publish(pin_id, "comment.created", {"pin_id": pin_id})
+    assert hub.snapshot()["channels"] == 0
+
+
+def test_resume_within_grace_window():
+    hub = _hub()
+    queue, _ = hub._subscribe(1, None)
+    hub.publish(1, "comment.created", {"n": 1})
+    first = queue.get_nowait()
+    hub._leave(hub._channels[1], queue)
+
+    # 구독자가 끊긴 동안의 이벤트도 grace 동안은 버퍼에 남음
+    hub.publish(1, "comment.created", {"n": 2})
+    _, head = hub._subscribe(1, _event_id(first))
+    assert [b"event: comment.created" in frame and b'"n":2' in frame for frame in head[1:]] == [True]
+
+
+def test_resume_after_grace_window_resets():
+    hub = _hub(grace=0)
+    queue, _ = hub._subscribe(1, None)
+    hub.publish(1, "comment.created", {"n": 1})
+    first = queue.get_nowait()
+    hub._leave(hub._channels[1], queue)
+
+    hub.publish(1, "comment.created", {"n": 2})
+    assert hub.snapshot()["channels"] == 0
+    _, head = hub._subscribe(1, _event_id(first))
+    assert b"event: reset" in head[1]
@@ -0,0 +1,14 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from services.pagination import encode_cursor
+
+
+@pytest.mark.parametrize("values", [("a", "b"), (1.0, "x"), (1.5, 2.0), (True, 1), (1.0, False)])
+def test_feed_rejects_cursor_of_wrong_type(values):
+    # 커서 검증은 스냅샷/DB 조회 전에 끝나므로 lifespan 없이 호출
+    client = TestClient(main.app)
+    response = client.get("/api/pins/feed", params={"cursor": encode_cursor(*values)})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,117 @@
+import hashlib
+import time
+
+import pytest
+from sqlalchemy import select, update
+
+import config
+import database
+from api.models import Image
+from services import jobs
+from tests.conftest import GIF
+
+failures: dict[str, int] = {}
+
+
+@jobs.handler("tests.flaky")
+async def flaky(name: str) -> None:
+    # 남은 실패 횟수만큼 실패 후 성공
+    if failures.get(name, 0) > 0:
+        failures[name] -= 1
+        raise RuntimeError(f"{name} failed")
+
+
+@pytest.fixture
+def fast_jobs(client, monkeypatch):
+    monkeypatch.setattr(config, "JOBS_BACKOFF_SECONDS", 0.01)
+    monkeypatch.setattr(jobs.pool, "poll_interval", 0.02)
+
+
+def enqueue(client, name: str, **options) -> int:
+    # 작업 풀이 도는 앱의 이벤트 루프에서 등록
+    async def run() -> int:
+        async with database.AsyncSessionLocal() as db:
+            job_id = await jobs.enqueue(db, "tests.flaky", {"name": name}, key=f"tests:{name}", **options)
+            await db.commit()
+        jobs.pool.wake()
+        return job_id
+    return client.portal.call(run)
+
+
+def wait_finished(client, job_id: int) -> dict:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        job = client.get(f"/api/jobs/{job_id}").json()
+        if job["status"] in ("done", "failed"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_backoff_doubles_and_is_capped(monkeypatch):
+    monkeypatch.setattr(config, "JOBS_BACKOFF_SECONDS", 1)
+    monkeypatch.setattr(config, "JOBS_BACKOFF_MAX_SECONDS", 10)
+    for attempts, delay in [(1, 1), (2, 2), (3, 4), (10, 10)]:
+        assert delay / 2 <= jobs.backoff(attempts) <= delay
+
+
+def test_failed_job_is_retried_until_it_succeeds(client, fast_jobs):
+    failures["retry"] = 2
+    job = wait_finished(client, enqueue(client, "retry"))
+    assert job["status"] == "done"
+    assert job["attempts"] == 3
+    assert job["last_error"] is None
+
+
+def test_job_fails_after_max_attempts(client, fast_jobs):
+    failures["exhausted"] = 5
+    job = wait_finished(client, enqueue(client, "exhausted", max_attempts=2))
+    assert job["status"] == "failed"
+    assert job["attempts"] == 2
+    assert job["last_error"] == "RuntimeError: exhausted failed"
+
+
+def test_same_key_returns_existing_job_unless_requeued(client, fast_jobs):
+    failures["requeue"] = 1
+    job_id = enqueue(client, "requeue", max_attempts=1)
+    assert wait_finished(client, job_id)["status"] == "failed"
+
+    # requeue 없이는 끝난 작업을 그대로 반환
+    assert enqueue(client, "requeue") == job_id
+    assert client.get(f"/api/jobs/{job_id}").json()["status"] == "failed"
+
+    assert enqueue(client, "requeue", requeue=True) == job_id
+    job = wait_finished(client, job_id)
+    assert job["status"] == "done"
+    assert job["attempts"] == 1
+
+
+def upload(client, user_id: int):
+    return client.post(
+        "/api/pins/",
+        data={"user_id": user_id, "title": "pin", "content": "content"},
+        files={"image": ("pin.gif", GIF, "image/gif")},
+    )
+
+
+def test_thumbnails_are_requeued_while_variants_are_missing(client, make_user, fast_jobs):
+    user_id = make_user()
+    response = upload(client, user_id)
+    job_id = int(response.headers["X-Job-Id"])
+    assert wait_finished(client, job_id)["status"] == "done"
+
+    # 리사이즈가 끝난 이미지는 같은 작업을 반환만 함
+    assert int(upload(client, user_id).headers["X-Job-Id"]) == job_id
+    assert client.get(f"/api/jobs/{job_id}").json()["attempts"] == 1
+
+    # 변형 기록이 없는 이미지 (예: 이전 작업이 결과를 남기지 못함) 는 같은 작업을 다시 실행
+    digest = hashlib.sha256(GIF).hexdigest()
+    with database.SessionLocal() as db:
+        db.execute(update(Image).where(Image.digest == digest).values(variants=None))
+        db.commit()
+    assert int(upload(client, user_id).headers["X-Job-Id"]) == job_id
+    job = wait_finished(client, job_id)
+    assert job["status"] == "done"
+    assert job["attempts"] == 1
+    with database.SessionLocal() as db:
+        assert db.execute(select(Image.variants).where(Image.digest == digest)).scalar_one() is not None
@@ -0,0 +1,112 @@
+import asyncio
+
+import config
+from services import likes
+from services.likes import LikeBuffer
+
+
+class SlowBuffer(LikeBuffer):
+    """
+    DB 대신 반영된 항목을 기록하고, 반영에 시간이 걸리는 버퍼
+    """
+
+    def __init__(self):
+        super().__init__(flush_interval=0.01, batch_size=2)
+        self.applied = []
+        self.started = asyncio.Event()
+
+    async def _apply(self, batch):
+        self.started.set()
+        await asyncio.sleep(0.1)
+        self.applied += batch
+
+
+def test_close_waits_for_running_batch():
+    async def scenario():
+        buffer = SlowBuffer()
+        for pin_id in range(1, 5):
+            await buffer.submit(1, pin_id, True)
+
+        # 첫 배치를 반영하는 도중에 종료
+        await buffer.started.wait()
+        await buffer.close()
+        return buffer
+
+    buffer = asyncio.run(scenario())
+    assert sorted(buffer.applied) == [((1, pin_id), True) for pin_id in range(1, 5)]
+    assert buffer._pending == {}
+
+
+def test_cancelled_flush_keeps_batch():
+    async def scenario():
+        buffer = SlowBuffer()
+        await buffer.submit(1, 1, True)
+        await buffer.submit(1, 2, False)
+        await buffer.started.wait()
+
+        # 반영 중 취소되어도 배치는 대기열로 돌아가야 함
+        buffer._task.cancel()
+        try:
+            await buffer._task
+        except asyncio.CancelledError:
+            pass
+        return buffer
+
+    buffer = asyncio.run(scenario())
+    assert buffer.applied == []
+    assert buffer._pending == {(1, 1): True, (1, 2): False}
+
+
+def counts(client, pin_id: int) -> int:
+    response = client.get("/api/pins/counts", params={"ids": pin_id})
+    assert response.status_code == 200
+    return response.json()["items"][0]["like_count"]
+
+
+def test_put_and_delete_like_are_idempotent(client, make_user, make_pin):
+    user_id, other_id = make_user(), make_user()
+    pin_id = make_pin(user_id)
+    url = f"/api/pins/{pin_id}/likes"
+
+    for _ in range(2):
+        response = client.put(url, json={"user_id": user_id})
+        assert response.status_code == 200
+        assert response.json() == {"user_id": user_id, "pin_id": pin_id, "liked": True}
+    assert counts(client, pin_id) == 1
+
+    # POST 는 이미 좋아요한 경우 409, 카운터는 그대로
+    assert client.post(url, json={"user_id": user_id}).status_code == 409
+    assert client.post(url, json={"user_id": other_id}).status_code == 200
+    assert counts(client, pin_id) == 2
+
+    for _ in range(2):
+        response = client.request("DELETE", url, json={"user_id": user_id})
+        assert response.status_code == 200
+        assert response.json()["liked"] is False
+    assert counts(client, pin_id) == 1
+    assert client.get(f"/api/pins/{pin_id}").json()["like_count"] == 1
+    assert client.get(f"/api/users/{other_id}/likes/ids", params={"pin_ids": pin_id}).json()["items"] == [pin_id]
+    assert client.get(f"/api/users/{user_id}/likes/ids", params={"pin_ids": pin_id}).json()["items"] == []
+
+
+def test_like_on_missing_pin_is_404(client, make_user):
+    user_id = make_user()
+    assert client.put("/api/pins/999999/likes", json={"user_id": user_id}).status_code == 404
+    assert client.post("/api/pins/999999/likes", json={"user_id": user_id}).status_code == 404
+
+
+def test_write_behind_likes_keep_counter_consistent(client, make_user, make_pin, monkeypatch):
+    monkeypatch.setattr(config, "LIKE_WRITE_BEHIND", True)
+    user_id = make_user()
+    pin_id = make_pin(user_id)
+    url = f"/api/pins/{pin_id}/likes"
+
+    # 반영 전 마지막 상태만 남음 (좋아요 → 취소 → 좋아요)
+    for method in ("PUT", "PUT", "DELETE", "PUT"):
+        assert client.request(method, url, json={"user_id": user_id}).status_code == 202
+    client.portal.call(likes.buffer.flush)
+    assert counts(client, pin_id) == 1
+
+    client.request("DELETE", url, json={"user_id": user_id})
+    client.portal.call(likes.buffer.flush)
+    assert counts(client, pin_id) == 0
@@ -0,0 +1,26 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from services import metrics
+
+
+def test_failed_statement_does_not_leak_timing():
+    engine = create_engine("sqlite://")
+    stats = metrics.RequestStats()
+    token = metrics._current.set(stats)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY)"))
+            conn.execute(text("INSERT INTO t VALUES (1)"))
+            # 실패한 쿼리는 after_cursor_execute 가 없으므로 기록되지 않아야 함
+            with pytest.raises(exc.IntegrityError):
+                conn.execute(text("INSERT INTO t VALUES (1)"))
+            conn.execute(text("SELECT id FROM t")).all()
+
+            assert "query_started" not in conn.info
+    finally:
+        metrics._current.reset(token)
+        engine.dispose()
+
+    assert stats.queries == 3
+    assert stats.statements["SELECT id FROM t"] == 1
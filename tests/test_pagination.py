@@ -0,0 +1,84 @@
+import pytest
+
+from conftest import walk
+from services.pagination import encode_cursor
+
+
+def test_user_pins_pages_are_complete_and_unique(client, make_user, make_pin):
+    user_id = make_user()
+    # 같은 초에 만들어진 핀이 많아 pin_id 로 순서가 갈림
+    pin_ids = [make_pin(user_id) for _ in range(7)]
+
+    items = walk(client, f"/api/users/{user_id}/pins", limit=3)
+    assert [item["pin_id"] for item in items] == pin_ids[::-1]
+
+
+def test_pin_list_pages_have_no_duplicates(client, make_user, make_pin):
+    user_id = make_user()
+    pin_ids = [make_pin(user_id) for _ in range(5)]
+
+    ids = [item["pin_id"] for item in walk(client, "/api/pins/", limit=2)]
+    assert len(ids) == len(set(ids))
+    # 최근 수정 순: 방금 만든 핀이 역순으로 모두 포함
+    assert [pin_id for pin_id in ids if pin_id in pin_ids] == pin_ids[::-1]
+
+
+@pytest.mark.parametrize(
+    "url, values",
+    [
+        ("/api/pins/", ("x", 1)),
+        ("/api/pins/", (1, "a")),
+        ("/api/pins/", ("2026-01-01 00:00:00", 1.5)),
+        ("/api/pins/", ("2026-01-01 00:00:00",)),
+        ("/api/pins/search", ("a", 1, "2026-01-01 00:00:00")),
+        ("/api/pins/search", (1.0, 1, "now")),
+    ],
+)
+def test_malformed_cursor_is_rejected(client, url, values):
+    response = client.get(url, params={"search": "pin", "cursor": encode_cursor(*values)})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_liked_pins_pages_are_complete_and_unique(client, make_user, make_pin):
+    owner, fan = make_user(), make_user()
+    pin_ids = [make_pin(owner) for _ in range(7)]
+    for pin_id in pin_ids:
+        assert client.put(f"/api/pins/{pin_id}/likes", json={"user_id": fan}).status_code == 200
+
+    # 최근에 즐겨찾기한 순 (같은 초면 like_id 역순)
+    items = walk(client, f"/api/users/{fan}/likes", limit=3)
+    assert [item["pin_id"] for item in items] == pin_ids[::-1]
+    assert walk(client, f"/api/users/{fan}/likes/ids", limit=2) == pin_ids[::-1]
+
+
+@pytest.mark.parametrize("path", ["likes", "likes/ids"])
+@pytest.mark.parametrize("values", [(1, 1), ("2026-01-01 00:00:00", "1"), ("x", 1), ("2026-01-01 00:00:00", True)])
+def test_liked_pins_reject_malformed_cursor(client, make_user, path, values):
+    user_id = make_user()
+    response = client.get(f"/api/users/{user_id}/{path}", params={"cursor": encode_cursor(*values)})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("order", ["oldest", "newest"])
+def test_comment_pages_are_complete_and_unique(client, make_user, make_pin, order):
+    user_id = make_user()
+    pin_id = make_pin(user_id)
+    comment_ids = [
+        client.post(f"/api/pins/{pin_id}/comments", json={"user_id": user_id, "content": f"c{n}"}).json()["comment_id"]
+        for n in range(7)
+    ]
+
+    items = walk(client, f"/api/pins/{pin_id}/comments", limit=3, order=order)
+    expected = comment_ids if order == "oldest" else comment_ids[::-1]
+    assert [item["comment_id"] for item in items] == expected
+
+
+@pytest.mark.parametrize("order", ["oldest", "newest"])
+@pytest.mark.parametrize("values", [("x", 1), (1, 1), ("2026-01-01 00:00:00", 1.5)])
+def test_comments_reject_malformed_cursor(client, make_user, make_pin, order, values):
+    pin_id = make_pin(make_user())
+    response = client.get(
+        f"/api/pins/{pin_id}/comments", params={"order": order, "cursor": encode_cursor(*values)}
+    )
+    assert response.status_code == 400